@@ -219,6 +219,9 @@ class StufioSettings(BaseStufioSettings):
 
     # MODULES SETTINGS
     MODULES_DIR: Optional[str] = None
+    # Cache module discovery results on disk between process starts; meant for
+    # short-lived CLI runs, servers should discover modules on every start
+    MODULES_DISCOVERY_CACHE: bool = False
 
     STUFIO_MODULES_DIR: str = os.path.normpath(
         os.path.join(
@@ -32,7 +32,8 @@ class MigrationManager:
 
         logger.debug(f"Discovering core app migrations in {migrations_base_path}")
 
-        if not os.path.exists(migrations_base_path) or not os.path.isdir(migrations_base_path):
+        version_entries = self.scan_version_dirs(migrations_base_path)
+        if not version_entries:
             logger.debug("No migrations directory found for core app")
             return
 
@@ -44,14 +45,9 @@ class MigrationManager:
             self.migrations[module_name] = {}
 
         # Get all version directories
-        for version_dir in os.listdir(migrations_base_path):
-            if version_dir.startswith('__'):
-                continue
-            version_path = os.path.join(migrations_base_path, version_dir)
-
-            # Skip non-directories and special directories
-            if not os.path.isdir(version_path) or version_dir.startswith('__'):
-                continue
+        for entry in version_entries:
+            version_dir = entry.name
+            version_path = entry.path
 
             # Check if the directory matches our date-based version pattern
             version_match = self.VERSION_PATTERN.match(version_dir)
@@ -70,7 +66,31 @@ class MigrationManager:
                 import_path_generator=lambda rel_path: f"stufio.core.migrations.migrations.{version_dir}.{os.path.splitext(os.path.basename(rel_path))[0]}"
             )
 
-    def discover_module_migrations(self, module_path: str, module_name: str, module_version: str, module_import_path: Optional[str] = None) -> None:
+    @staticmethod
+    def scan_version_dirs(migrations_path: str) -> List[os.DirEntry]:
+        """
+        List the version directories of a migrations folder.
+
+        Uses os.scandir so directory checks reuse the cached entry type instead of
+        issuing a stat() per entry. Returns an empty list if the folder is missing.
+        """
+        try:
+            with os.scandir(migrations_path) as it:
+                return [
+                    entry for entry in it
+                    if not entry.name.startswith('__') and entry.is_dir()
+                ]
+        except (FileNotFoundError, NotADirectoryError):
+            return []
+
+    def discover_module_migrations(
+        self,
+        module_path: str,
+        module_name: str,
+        module_version: str,
+        module_import_path: Optional[str] = None,
+        version_entries: Optional[List[os.DirEntry]] = None,
+    ) -> None:
         """
         Discover migrations in a module.
         
@@ -79,12 +99,15 @@ class MigrationManager:
             module_name: Name of the module
             module_version: Module version (ignored for date-based migrations)
             module_import_path: Optional pre-calculated import path for the module
+            version_entries: Optional pre-scanned version directories (see scan_version_dirs)
         """
         migrations_path = os.path.join(module_path, "migrations")
 
-        if not os.path.exists(migrations_path):
-            logger.debug(f"No migrations folder, skipping: {migrations_path}")  
-            return
+        if version_entries is None:
+            if not os.path.isdir(migrations_path):
+                logger.debug(f"No migrations folder, skipping: {migrations_path}")
+                return
+            version_entries = self.scan_version_dirs(migrations_path)
 
         # If no import path provided, calculate it (for backward compatibility)
         if module_import_path is None:
@@ -102,12 +125,9 @@ class MigrationManager:
 
         # For modules, look for date-based version directories like v20250308
         try:
-            for version_dir in os.listdir(migrations_path):
-                version_dir_path = os.path.join(migrations_path, version_dir)
-
-                # Skip non-directories and special directories
-                if not os.path.isdir(version_dir_path) or version_dir.startswith('__'):
-                    continue
+            for entry in version_entries:
+                version_dir = entry.name
+                version_dir_path = entry.path
 
                 # Check if the directory matches our date-based version pattern
                 version_match = self.VERSION_PATTERN.match(version_dir)
@@ -1,37 +1,80 @@
+import asyncio
+import copy
+import hashlib
 import importlib
-import inspect
+import importlib.metadata
+import importlib.util
+import json
 import logging
 import os
 import pkgutil
-from typing import Dict, List, Optional, Tuple
+import sys
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from itertools import chain
+from types import MappingProxyType, ModuleType
+from typing import Any, Callable, ClassVar, Dict, List, Mapping, Optional, Tuple
 from fastapi import FastAPI
 from pathlib import Path
 
 # Remove the external app dependency
 from stufio.core.config import get_settings
-from stufio.core.migrations.manager import migration_manager
-from stufio.api.admin import admin_router, internal_router
-import traceback
+from stufio.__version__ import __version__
 
 logger = logging.getLogger(__name__)
 
+# Marks a submodule that ModuleInfo.get_submodule has not looked up yet
+_NOT_LOADED = object()
+
+# Distribution names allow dashes where the import name has underscores
+_DIST_TO_MODULE_NAME = str.maketrans("-", "_")
+
+
+@lru_cache(maxsize=1)
+def _module_distribution_names(sys_path: Tuple[str, ...], prefixes: Tuple[str, ...]) -> Tuple[str, ...]:
+    """
+    Get the lowercased names of installed distributions starting with one of prefixes.
+
+    Reading every distribution's metadata is the slow part of discovery, so the
+    result is cached; sys_path is only the cache key, a changed sys.path rescans.
+    """
+    names = ((dist.metadata["Name"] or "").lower() for dist in importlib.metadata.distributions())
+    return tuple(name for name in names if name.startswith(prefixes))
+
+
+@lru_cache(maxsize=1)
+def _module_entry_points(sys_path: Tuple[str, ...], group: str) -> Tuple[Tuple[str, str], ...]:
+    """Get ``(name, module)`` pairs declared in an entry point group, cached like the above."""
+    entry_points = importlib.metadata.entry_points()
+    if hasattr(entry_points, "select"):
+        selected = entry_points.select(group=group)
+    else:  # Python 3.9 returns a plain dict of groups
+        selected = entry_points.get(group, ())
+    return tuple(dict.fromkeys((ep.name, ep.module) for ep in selected))
+
 
 class ModuleRegistry:
     """Registry for all modules in the application."""
 
     def __init__(self):
-        self.modules: Dict[str, "ModuleInterface"] = {}  # Module instances
-        self.module_infos: Dict[str, ModuleInfo] = {}  # Module information objects
+        self.modules: Mapping[str, "ModuleInterface"] = {}  # Module instances, read-only after finalize
+        self._frozen = False
+        self.module_infos: Mapping[str, ModuleInfo] = {}  # Module information objects, read-only view
+        self._interface_cls: Dict[str, type] = {}  # Resolved ModuleInterface classes
+        self._all_middlewares_cache: Optional[List[tuple]] = None  # Reset when modules change
+        self._ordered_modules: Optional[Tuple[Tuple[str, "ModuleInterface"], ...]] = None  # Set by finalize
+        self._hooks_cache: Dict[str, List[Tuple[str, Callable]]] = {}  # Bound hooks per hook name
+        self._discover_cache: Optional[Tuple[tuple, Mapping[str, ModuleInfo]]] = None  # (key, module_infos)
         settings = get_settings()
         self.router_prefix = getattr(settings, "API_V1_STR", "/api/v1")
 
     def get_module_instance(self, module_name: str) -> Optional["ModuleInterface"]:
         """Get the module instance by name."""
-        if module_name in self.modules:
-            return self.modules[module_name]
-        else:
-            logger.warning(f"Module {module_name} not found in registry")
-            return None
+        module = self.modules.get(module_name)
+        if module is None:
+            logger.warning("Module %s not found in registry", module_name)
+        return module
 
     def discovered_modules(self) -> Dict[str, str]:
         """Return the list of discovered modules with path."""
@@ -50,50 +93,243 @@ class ModuleRegistry:
         """
         settings = get_settings()
 
+        app_modules_dir = self._app_modules_dir(settings)
+
+        explicit_modules = getattr(settings, "ADDITIONAL_MODULES", [])
+        watch_dirs = [settings.STUFIO_MODULES_DIR]
+
+        # Repeated discovery (reloads, tests) reuses the last result until inputs change
+        discover_key = self._discover_key(app_modules_dir, watch_dirs, explicit_modules)
+        if self._discover_cache is not None and self._discover_cache[0] == discover_key:
+            self.module_infos = self._discover_cache[1]
+            logger.debug("Reusing previous module discovery result")
+            return list(self.module_infos.keys())
+
         # Configure the module discoverer
         discoverer = ModuleDiscoverer(
-            # Handle MODULES_DIR, which can be a string or list
-            app_modules_dir=(settings.MODULES_DIR[0] if isinstance(settings.MODULES_DIR, list) and
-                             len(settings.MODULES_DIR) > 0 else settings.MODULES_DIR or 
-                             ModuleDiscoverer.DEFAULT_APP_MODULES_DIR),
+            app_modules_dir=app_modules_dir,
             # Use app modules import path
             app_modules_base_import_path="app.modules",
             # Standard package prefix
             package_prefix="stufio.modules.",
             # Include any explicit modules from settings
-            explicit_modules=getattr(settings, "ADDITIONAL_MODULES", [])
+            explicit_modules=explicit_modules,
+            # Reuse the previous discovery result while nothing has changed on disk
+            cache_path=self._discovery_cache_path(),
+            watch_dirs=watch_dirs,
         )
 
         # Perform discovery using the discoverer
-        self.module_infos = discoverer.discover()
-        logger.info(f"Discovered {len(self.module_infos)} modules")
+        # Discovery results are fixed until the next discovery; share them read-only
+        self.module_infos = MappingProxyType(discoverer.discover())
+        self._discover_cache = (discover_key, self.module_infos)
+        logger.info("Discovered %s modules", len(self.module_infos))
 
         # Return list of discovered module names
         discovered_modules = list(self.module_infos.keys())
 
         if discovered_modules:
-            logger.info(f"Discovered modules: {', '.join(discovered_modules)}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Discovered modules: %s", ", ".join(discovered_modules))
         else:
             logger.warning("No modules found")
 
         return discovered_modules
 
+    def invalidate_cache(self) -> None:
+        """
+        Forget cached discovery results so the next discover_modules() rescans.
+        Clears the in-process result, the cached package metadata scans and the
+        on-disk discovery cache. Useful in development after installing modules.
+        """
+        self._discover_cache = None
+        _module_distribution_names.cache_clear()
+        _module_entry_points.cache_clear()
+        ModuleDiscoverer(cache_path=self._discovery_cache_path()).invalidate_cache()
+
+    @staticmethod
+    def _discovery_cache_path() -> Optional[str]:
+        """Get the on-disk discovery cache file for the configured app modules dir."""
+        settings = get_settings()
+        if not getattr(settings, "MODULES_DISCOVERY_CACHE", False):
+            return None
+        return ModuleDiscoverer.default_cache_path(ModuleRegistry._app_modules_dir(settings))
+
+    @staticmethod
+    def _app_modules_dir(settings) -> str:
+        """Handle MODULES_DIR, which can be a string or list."""
+        return (settings.MODULES_DIR[0] if isinstance(settings.MODULES_DIR, list) and
+                len(settings.MODULES_DIR) > 0 else settings.MODULES_DIR or
+                ModuleDiscoverer.DEFAULT_APP_MODULES_DIR)
+
+    @staticmethod
+    def _discover_key(app_modules_dir: str, watch_dirs: List[str], explicit_modules: List[str]) -> tuple:
+        """Build the key that invalidates the in-process discovery cache."""
+        mtimes = []
+        for directory in (app_modules_dir, *watch_dirs):
+            try:
+                mtimes.append(os.stat(directory).st_mtime_ns)
+            except OSError:
+                mtimes.append(None)
+        return (tuple(sys.path), tuple(explicit_modules), tuple(mtimes))
+
     def load_module(self, module_name: str, discover_migrations: bool = False) -> Optional["ModuleInterface"]:
         """Load a module by name and return its ModuleInterface implementation."""
+        instance = self.modules.get(module_name)
+        if instance is not None:
+            return instance
+
+        instance = self._create_module_instance(module_name)
+        if discover_migrations:
+            self._discover_module_migrations(module_name)
+        if instance is not None:
+            self._add_instance(module_name, instance)
+        return instance
+
+    def load_all(
+        self,
+        module_names: List[str],
+        discover_migrations: bool = False,
+        max_workers: int = 1,
+    ) -> Dict[str, "ModuleInterface"]:
+        """Load several modules.
+
+        Modules are imported one by one in the calling thread by default, since
+        module packages import each other and register settings as they are
+        imported. Passing ``max_workers`` > 1 opts into importing them in a
+        thread pool; only do so for packages that are safe to import
+        concurrently. Once every import has finished, migrations are discovered
+        and instances are registered in the order of ``module_names``, as with
+        ``load_module``, so both orders stay deterministic.
+        """
+        # Modules that are already loaded (or listed twice) are not imported again
+        loaded = {}
+        pending = []
+        seen = set()
+        for name in module_names:
+            if name in seen:
+                continue
+            seen.add(name)
+            if name in self.modules:
+                loaded[name] = self.modules[name]
+            else:
+                pending.append(name)
+        if not pending:
+            return loaded
+
+        # _create_module_instance logs and returns None on failure
+        workers = min(max_workers, len(pending))
+        if workers <= 1:
+            instances = {name: self._create_module_instance(name) for name in pending}
+        else:
+            instances = {}
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="stufio-load") as executor:
+                futures = {
+                    executor.submit(self._create_module_instance, name): name
+                    for name in pending
+                }
+                for done, future in enumerate(as_completed(futures), 1):
+                    instances[futures[future]] = future.result()
+                    logger.debug("Loaded %s/%s modules", done, len(pending))
+
+        failed = []
+        for module_name in pending:
+            if discover_migrations:
+                self._discover_module_migrations(module_name)
+            instance = instances[module_name]
+            if instance is None:
+                failed.append(module_name)
+                continue
+            self._add_instance(module_name, instance)
+            loaded[module_name] = instance
+
+        if failed:
+            logger.error("Failed to load %s of %s modules: %s", len(failed), len(pending), ", ".join(failed))
+        return loaded
+
+    def _add_instance(self, module_name: str, instance: "ModuleInterface") -> None:
+        """Register a loaded module instance and reset caches derived from the module set."""
+        if self._frozen:
+            # Loading after finalize() reopens the registry until the next finalize()
+            self.modules = dict(self.modules)
+            self._frozen = False
+        self.modules[module_name] = instance
+        self._all_middlewares_cache = None
+        self._ordered_modules = None
+        self._hooks_cache = {}
+
+    def finalize(self) -> Tuple[Tuple[str, "ModuleInterface"], ...]:
+        """
+        Fix the order modules are registered, started and shut down in.
+
+        Modules are sorted topologically on their ``depends_on`` names (Kahn's
+        algorithm), keeping load order between independent modules. Call this
+        once all modules are loaded; ``modules`` becomes a read-only view until
+        another module is loaded, which also resets the order.
+        """
+        self._ordered_modules = self._dependency_order()
+        self._hooks_cache = {}
+        if not self._frozen:
+            self.modules = MappingProxyType(dict(self.modules))
+            self._frozen = True
+        return self._ordered_modules
+
+    def _dependency_order(self) -> Tuple[Tuple[str, "ModuleInterface"], ...]:
+        """Sort the loaded modules topologically on their ``depends_on`` names."""
+        names = list(self.modules)
+        dependents: Dict[str, List[str]] = {name: [] for name in names}
+        pending_deps: Dict[str, int] = {}
+        for name in names:
+            deps = [dep for dep in dict.fromkeys(getattr(self.modules[name], "depends_on", ()) or ())
+                    if dep != name]
+            missing = [dep for dep in deps if dep not in dependents]
+            if missing:
+                logger.warning("Module %s depends on modules that are not loaded: %s", name, ", ".join(missing))
+            deps = [dep for dep in deps if dep in dependents]
+            for dep in deps:
+                dependents[dep].append(name)
+            pending_deps[name] = len(deps)
+
+        ready = deque(name for name in names if not pending_deps[name])
+        order = []
+        while ready:
+            name = ready.popleft()
+            order.append(name)
+            for dependent in dependents[name]:
+                pending_deps[dependent] -= 1
+                if not pending_deps[dependent]:
+                    ready.append(dependent)
+
+        if len(order) < len(names):
+            cyclic = [name for name in names if pending_deps[name]]
+            logger.error("Circular module dependencies between: %s", ", ".join(cyclic))
+            order.extend(cyclic)
+
+        return tuple((name, self.modules[name]) for name in order)
+
+    @property
+    def ordered_modules(self) -> Tuple[Tuple[str, "ModuleInterface"], ...]:
+        """Loaded modules as ``(name, module)`` pairs in dependency order."""
+        if self._ordered_modules is None:
+            # Sorted until modules change; unlike finalize() this leaves modules writable
+            self._ordered_modules = self._dependency_order()
+        return self._ordered_modules
+
+    def _create_module_instance(self, module_name: str) -> Optional["ModuleInterface"]:
+        """Import a module and instantiate its ModuleInterface without registering it."""
         try:
-            logger.debug(f"Loading module: {module_name}")
+            logger.debug("Loading module: %s", module_name)
 
             # Get ModuleInfo for this module
-            if module_name not in self.module_infos:
-                logger.error(f"Module info for {module_name} not found. Did you run discover_modules first?")
+            module_info = self.module_infos.get(module_name)
+            if module_info is None:
+                logger.error("Module info for %s not found. Did you run discover_modules first?", module_name)
                 return None
 
-            module_info = self.module_infos[module_name]
-
             # Get module directory using ModuleInfo method
             module_dir = module_info.get_filesystem_path()
             if not module_dir:
-                logger.error(f"Could not determine directory for module {module_name}")
+                logger.error("Could not determine directory for module %s", module_name)
                 return None
 
             # Get module using ModuleInfo
@@ -101,68 +337,183 @@ class ModuleRegistry:
                 module = module_info.get_module()
             except Exception as e:
                 logger.error(
-                    f"❌ Failed to import module {module_name} from {module_info.path}: {e}"
+                    "❌ Failed to import module %s from %s: %s", module_name, module_info.path, e
                 )
                 return None
 
-            # Get module version
-            version = getattr(module, "version", "0.0.0")
-            if hasattr(module, "version") and isinstance(module.version, str):
-                version = module.version
-
-            # Discover migrations if requested
-            if discover_migrations:
-                migration_manager.discover_module_migrations(
-                    module_path=module_dir,
-                    module_name=module_name, 
-                    module_version=version,
-                    module_import_path=module_info.path
-                )
+            version = self._module_version(module)
 
             # Find ModuleInterface implementation
-            logger.debug(f"Looking for ModuleInterface implementation in {module_name}")
-            for name, obj in inspect.getmembers(module):
-                if inspect.isclass(obj) and issubclass(obj, ModuleInterface) and obj != ModuleInterface:
-                    # Create an instance of the module interface WITH ModuleInfo
-                    instance = obj(module_info=module_info)
-                    instance.name = module_name
-                    instance.version = version
-
-                    self.modules[module_name] = instance
-                    logger.info(f"Successfully loaded module: {module_name} (v{version})")
-                    return instance
-
-            logger.warning(f"Module {module_name} does not implement ModuleInterface")
+            logger.debug("Looking for ModuleInterface implementation in %s", module_name)
+            interface_cls = self._find_interface_class(module_name, module)
+            if interface_cls is None:
+                logger.warning("Module %s does not implement ModuleInterface", module_name)
+                return None
+
+            # Create an instance of the module interface WITH ModuleInfo
+            instance = interface_cls(module_info=module_info)
+            instance.name = module_name
+            instance.version = version
+
+            logger.info("Successfully loaded module: %s (v%s)", module_name, version)
+            return instance
+
+        except Exception:
+            logger.exception("❌ Failed to load module %s", module_name)
             return None
 
+    @staticmethod
+    def _module_version(module) -> str:
+        """Get a module's version string, defaulting to 0.0.0."""
+        # Read the namespace directly so a "version" submodule is not imported lazily
+        version = vars(module).get("version")
+        return version if isinstance(version, str) else "0.0.0"
+
+    def _discover_module_migrations(self, module_name: str) -> None:
+        """
+        Register the migrations of an imported module with the migration manager.
+
+        The manager runs migrations across modules in the order they were
+        discovered, so callers invoke this in load order, never from the import
+        threads. Modules that failed to import are skipped.
+        """
+        module_info = self.module_infos.get(module_name)
+        if module_info is None or module_info._module is None:
+            return
+        module_dir = module_info.get_filesystem_path()
+        if not module_dir:
+            return
+
+        from stufio.core.migrations.manager import migration_manager
+
+        migration_manager.discover_module_migrations(
+            module_path=module_dir,
+            module_name=module_name,
+            module_version=self._module_version(module_info._module),
+            # Import path recorded at discovery; avoids re-deriving it from the directory
+            module_import_path=module_info.path,
+        )
+
+    def _find_interface_class(self, module_name: str, module) -> Optional[type]:
+        """Resolve the ModuleInterface subclass exposed by a module.
+
+        A module can declare its interface explicitly with an ``__interface__``
+        or ``MODULE_CLASS`` attribute, or by naming the class ``Module``; otherwise,
+        or if the declared value is not a ModuleInterface subclass, the module
+        namespace is scanned once. The result is memoized per module
+        name so repeated loads skip the scan.
+        """
+        interface_cls = self._interface_cls.get(module_name)
+        if interface_cls is not None:
+            return interface_cls
+
+        namespace = vars(module)
+        interface_cls = None
+        for attr in ("__interface__", "MODULE_CLASS", "Module"):
+            declared = namespace.get(attr)
+            if (isinstance(declared, type) and declared is not ModuleInterface
+                    and issubclass(declared, ModuleInterface)):
+                interface_cls = declared
+                break
+            if declared is not None and attr != "Module":
+                logger.warning(
+                    "Module %s: %s is not a ModuleInterface subclass, ignoring it", module_name, attr
+                )
+        if interface_cls is None:
+            # ModuleInterface records its subclasses as their bodies execute, so
+            # only classes defined inside this package need to be considered
+            package = module.__name__
+            candidates = ModuleInterface._subclasses.get(package, ())
+            # Prefer the class the package exposes, e.g. re-exported from a submodule
+            interface_cls = next(
+                (cls for cls in candidates if namespace.get(cls.__name__) is cls),
+                candidates[0] if candidates else None,
+            )
+            if interface_cls is None:
+                # Interface defined in another package and re-exported here
+                interface_cls = next(
+                    (obj for obj in namespace.values()
+                     if isinstance(obj, type) and obj is not ModuleInterface
+                     and issubclass(obj, ModuleInterface)),
+                    None,
+                )
+
+        if interface_cls is not None:
+            self._interface_cls[module_name] = interface_cls
+        return interface_cls
+
+    def get_hooks(self, hook_name: str) -> List[Tuple[str, Callable]]:
+        """
+        Get ``(module_name, bound_method)`` pairs for a ModuleInterface hook.
+
+        Only modules that override the hook are included, in dependency order,
+        so callers skip the no-op base implementations. Methods are bound once
+        and reused until the module set changes.
+        """
+        hooks = self._hooks_cache.get(hook_name)
+        if hooks is None:
+            default = getattr(ModuleInterface, hook_name)
+            hooks = [
+                (module_name, getattr(module, hook_name))
+                for module_name, module in self.ordered_modules
+                if getattr(type(module), hook_name, default) is not default
+            ]
+            self._hooks_cache[hook_name] = hooks
+        return hooks
+
+    async def startup_all(self, app: FastAPI) -> None:
+        """Run on_startup of all modules concurrently; a failing module doesn't stop the others."""
+        await asyncio.gather(*(
+            self._run_hook(module_name, "on_startup", on_startup, app)
+            for module_name, on_startup in self.get_hooks("on_startup")
+        ))
+
+    async def shutdown_all(self, app: FastAPI) -> None:
+        """Run on_shutdown of all modules concurrently; a failing module doesn't stop the others."""
+        await asyncio.gather(*(
+            self._run_hook(module_name, "on_shutdown", on_shutdown, app)
+            for module_name, on_shutdown in reversed(self.get_hooks("on_shutdown"))
+        ))
+
+    @staticmethod
+    async def _run_hook(module_name: str, hook_name: str, hook: Callable, app: FastAPI) -> None:
+        """Await a module lifecycle hook, logging instead of raising on failure."""
+        try:
+            logger.info("Running %s for module: %s", hook_name, module_name)
+            await hook(app)
         except Exception as e:
-            logger.error(f"❌ Failed to load module {module_name}: {str(e)}")
-            traceback.print_exc()
-            return None
+            logger.error("Error in %s of module %s: %s", hook_name, module_name, e, exc_info=True)
 
     def get_all_middlewares(self) -> List[tuple]:
         """Get all framework and module middlewares."""
-        middlewares = []
+        # Middlewares are fixed once modules are loaded; the cache is reset on load
+        if self._all_middlewares_cache is not None:
+            return self._all_middlewares_cache
+
+        sources = []
 
         # First, add framework middlewares
         try:
             # Import framework middlewares
             from stufio.middleware.framework import get_framework_middlewares
             framework_middlewares = get_framework_middlewares()
-            middlewares.extend(framework_middlewares)
-            logger.info(f"Added {len(framework_middlewares)} framework middlewares")
+            sources.append(framework_middlewares)
+            logger.info("Added %s framework middlewares", len(framework_middlewares))
         except ImportError:
             logger.debug("No framework middlewares found")
 
-        # Then, add module middlewares
-        for module_name, module in self.modules.items():
+        # Then, add middlewares from modules that override the empty default
+        for module_name, get_middlewares in self.get_hooks("get_middlewares"):
             try:
-                module_middlewares = module.get_middlewares()
-                middlewares.extend(module_middlewares)
-                logger.info(f"Added {len(module_middlewares)} middlewares from module {module_name}")
+                module_middlewares = get_middlewares()
+                sources.append(module_middlewares)
+                logger.info("Added %s middlewares from module %s", len(module_middlewares), module_name)
             except Exception as e:
-                logger.error(f"Failed to get middlewares from module {module_name}: {e}")
+                logger.error("Failed to get middlewares from module %s: %s", module_name, e)
 
+        # Flatten once instead of growing a list per module
+        middlewares = list(chain.from_iterable(sources))
+        self._all_middlewares_cache = middlewares
         return middlewares
 
     def register_all_modules(self, app: FastAPI) -> None:
@@ -172,33 +523,34 @@ class ModuleRegistry:
             app.include_router(api_router, prefix=self.router_prefix)
             logger.info("Registered core API routes")
         except Exception as e:
-            logger.error(f"Failed to register core API routes: {str(e)}", exc_info=True)
+            logger.error("Failed to register core API routes: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
 
-        # Register each module - no longer passing module_dir
-        for module_name, module in self.modules.items():
+        # Register each module in dependency order
+        for module_name, module in self.ordered_modules:
             try:
                 module.register(app)
-                logger.info(f"Registered module: {module_name}")
+                logger.info("Registered module: %s", module_name)
             except Exception as e:
-                logger.error(f"Failed to register module {module_name}: {str(e)}", exc_info=True)
+                logger.error("Failed to register module %s: %s", module_name, e, exc_info=logger.isEnabledFor(logging.DEBUG))
 
         # Register admin/internal routes
         try:
-            app.include_router(admin_router, prefix=get_settings().API_V1_STR)
-            app.include_router(internal_router, prefix=get_settings().API_V1_STR)
+            from stufio.api.admin import admin_router, internal_router
+            app.include_router(admin_router, prefix=self.router_prefix)
+            app.include_router(internal_router, prefix=self.router_prefix)
             logger.info("Registered admin and internal routes")
         except Exception as e:
-            logger.error(f"Failed to register admin/internal routes: {str(e)}", exc_info=True)
+            logger.error("Failed to register admin/internal routes: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
 
     def unregister_all_modules(self, app: FastAPI) -> None:
         """Unregister all modules."""
 
-        for module_name, module in self.modules.items():
+        for module_name, unregister in self.get_hooks("unregister"):
             try:
-                module.unregister(app)
-                logger.info(f"Unregistered module: {module_name}")
+                unregister(app)
+                logger.info("Unregistered module: %s", module_name)
             except Exception as e:
-                logger.error(f"Failed to unregister module {module_name}: {e}")
+                logger.error("Failed to unregister module %s: %s", module_name, e)
 
     def get_module_submodule(self, module_name: str, submodule_path: str):
         """Get a submodule from a registered module.
@@ -210,16 +562,41 @@ class ModuleRegistry:
         Returns:
             The imported submodule or None if not found
         """
-        if module_name not in self.module_infos:
-            logger.error(f"Module '{module_name}' not found in registry")
+        module_info = self.module_infos.get(module_name)
+        if module_info is None:
+            logger.error("Module '%s' not found in registry", module_name)
             return None
 
-        return self.module_infos[module_name].get_submodule(submodule_path)
+        return module_info.get_submodule(submodule_path)
+
+
+class _LazyPackage(ModuleType):
+    """
+    Module type given to loaded module packages that list submodule names in
+    ``__lazy_submodules__``, so ``package.submodule`` imports those submodules
+    on first access. Packages can then leave heavy submodules (consumers,
+    services, ...) out of their ``__init__``. Any other missing attribute is an
+    AttributeError without importing anything.
+    """
+
+    def __getattr__(self, name: str):
+        if name in vars(self).get("__lazy_submodules__", ()):
+            try:
+                # import_module binds the submodule on this package, so this runs once per name
+                return importlib.import_module(f"{self.__name__}.{name}")
+            except Exception as e:
+                # Attribute lookups (hasattr, getattr with a default) only expect AttributeError
+                raise AttributeError(
+                    f"module {self.__name__!r} failed to import submodule {name!r}: {e}"
+                ) from e
+        raise AttributeError(f"module {self.__name__!r} has no attribute {name!r}")
 
 
 class ModuleInfo:
     """Holds information about a discovered module."""
 
+    __slots__ = ("name", "path", "source", "spec", "_module", "_fs_path", "_submodules")
+
     def __init__(
         self,
         name: str,
@@ -234,19 +611,29 @@ class ModuleInfo:
             spec  # Module spec, useful for finding file location etc.
         )
         self._module = None  # Lazily loaded module object
+        self._fs_path: Optional[str] = (  # Module directory, derived from the spec once
+            os.path.dirname(spec.origin) if spec and spec.origin else None
+        )
+        self._submodules: Dict[str, Optional[ModuleType]] = {}  # Imported submodules, None if missing
 
     def get_module(self):
         """Loads and returns the actual module object."""
         if self._module is None:
             try:
-                self._module = importlib.import_module(self.path)
-                logger.debug(f"Successfully imported module: {self.path}")
+                # Skip the import machinery when the package was already imported
+                module = sys.modules.get(self.path) or importlib.import_module(self.path)
+                namespace = vars(module)
+                if (type(module) is ModuleType and "__path__" in namespace
+                        and "__lazy_submodules__" in namespace and "__getattr__" not in namespace):
+                    module.__class__ = _LazyPackage
+                self._module = module
+                logger.debug("Successfully imported module: %s", self.path)
             except ImportError as e:
-                logger.error(f"❌ Failed to import module {self.path}: {e}")
+                logger.error("❌ Failed to import module %s: %s", self.path, e)
                 raise  # Re-raise to signal failure during loading
             except Exception as e:
                 logger.error(
-                    f"❌ An unexpected error occurred importing module {self.path}: {e}"
+                    "❌ An unexpected error occurred importing module %s: %s", self.path, e
                 )
                 raise
 
@@ -254,9 +641,7 @@ class ModuleInfo:
 
     def get_filesystem_path(self) -> Optional[str]:
         """Get the filesystem directory path for this module."""
-        if self.spec and self.spec.origin:
-            return os.path.dirname(self.spec.origin)
-        return None
+        return self._fs_path
 
     def get_import_path(self) -> str:
         """Get the import path for this module."""
@@ -272,30 +657,47 @@ class ModuleInfo:
             The imported submodule object
         """
         if not self.path:
-            logger.error(f"Cannot load submodule '{submodule_path}': parent module path is not set")
+            logger.error("Cannot load submodule '%s': parent module path is not set", submodule_path)
             return None
 
         full_path = f"{self.path}.{submodule_path}"
         try:
-            submodule = importlib.import_module(full_path)
-            logger.debug(f"Successfully imported submodule: {full_path}")
+            submodule = self._submodules.get(submodule_path, _NOT_LOADED)
+            if submodule is not _NOT_LOADED:
+                if submodule is None and critical:
+                    raise ModuleNotFoundError(f"No module named '{full_path}'", name=full_path)
+                return submodule
+
+            submodule = sys.modules.get(full_path)
+            if submodule is None:
+                # Probe first so optional submodules that don't exist don't raise
+                if importlib.util.find_spec(full_path) is None:
+                    self._submodules[submodule_path] = None
+                    if critical:
+                        raise ModuleNotFoundError(f"No module named '{full_path}'", name=full_path)
+                    logger.debug("Submodule %s not found", full_path)
+                    return None
+                submodule = importlib.import_module(full_path)
+            # Only lookups that succeeded or found nothing are remembered; errors are retried
+            self._submodules[submodule_path] = submodule
+            logger.debug("Successfully imported submodule: %s", full_path)
             return submodule
         except ImportError as e:
             if critical:
-                logger.error(f"❌ Failed to import critical submodule {full_path}: {e}")
+                logger.error("❌ Failed to import critical submodule %s: %s", full_path, e)
                 raise
-            logger.warning(f"Warning: Failed to import submodule {full_path}: {e}")
+            logger.warning("Warning: Failed to import submodule %s: %s", full_path, e)
             return None
         except ModuleNotFoundError as e:
             # Handle specific case where the submodule is not found
             if critical:
-                logger.error(f"❌ Critical submodule {full_path} not found: {e}")
+                logger.error("❌ Critical submodule %s not found: %s", full_path, e)
                 raise
-            logger.debug(f"Failed to import submodule {full_path}: {e}")
+            logger.debug("Failed to import submodule %s: %s", full_path, e)
             return None
         except Exception as e:
             logger.error(
-                f"❌ An unexpected error occurred importing submodule {full_path}: {e}"
+                "❌ An unexpected error occurred importing submodule %s: %s", full_path, e
             )
             return None
 
@@ -308,12 +710,15 @@ class ModuleDiscoverer:
     Discovers modules based on the configured sources and priority.
     - Priority 1: App Modules (from app_modules_dir)
     - Priority 2: Explicit Modules (from explicit_modules list)
-    - Priority 3: Installed Packages (from package_prefix)
+    - Priority 3: Installed Packages (from the ENTRY_POINT_GROUP entry points, then
+      by scanning package_prefix for packages that do not declare one)
     """
     # Default paths and prefixes
     DEFAULT_APP_MODULES_DIR = "app/modules"  # Default app modules directory
     DEFAULT_APP_MODULES_BASE_IMPORT_PATH = "app.modules"  # Default base import path
     DEFAULT_PACKAGE_PREFIX = "stufio.modules."  # Default package prefix for installed packages
+    DISTRIBUTION_PREFIXES = ("stufio-modules-", "stufio.modules.")  # Distribution names of module packages
+    ENTRY_POINT_GROUP = "stufio.modules"  # Entry point group installed module packages declare
     
     def __init__(
         self,
@@ -321,19 +726,47 @@ class ModuleDiscoverer:
         app_modules_base_import_path: str = DEFAULT_APP_MODULES_BASE_IMPORT_PATH,
         package_prefix: str = DEFAULT_PACKAGE_PREFIX,
         explicit_modules: Optional[List[str]] = None,
+        cache_path: Optional[str] = None,
+        watch_dirs: Optional[List[str]] = None,
     ):
         self.app_modules_path = Path(app_modules_dir).resolve()
         self.app_modules_base_import_path = app_modules_base_import_path
         self.package_prefix = package_prefix
-        self.explicit_modules = explicit_modules or []
+        self.explicit_modules = list(dict.fromkeys(explicit_modules or []))  # Drop duplicates, keep order
+        self.cache_path = cache_path  # Discovery cache file, None disables caching
+        self.watch_dirs = watch_dirs or []  # Extra directories whose changes invalidate the cache
         self.discovered_modules: Dict[str, ModuleInfo] = {}
 
-    def _get_short_name(self, module_path: str) -> str:
+    @classmethod
+    def default_cache_path(cls, app_modules_dir: str = DEFAULT_APP_MODULES_DIR) -> str:
+        """Get the per-application discovery cache file under the user cache directory."""
+        cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+        app_key = hashlib.sha1(str(Path(app_modules_dir).resolve()).encode()).hexdigest()[:16]
+        return os.path.join(cache_home, "stufio", f"discovery-{app_key}.json")
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _get_short_name(module_path: str) -> str:
         """Extracts the last component as the short name."""
         if "." in module_path:
             return module_path.split(".")[-1]
         return module_path  # Should not happen for valid package paths
 
+    def _is_discovered(self, name: str, path: str, source: str) -> bool:
+        """Checks whether a higher-priority source already provided this module.
+
+        Lets the scanners skip the spec lookup for candidates that
+        ``_add_module`` would ignore anyway.
+        """
+        existing = self.discovered_modules.get(name)
+        if existing is None:
+            return False
+        logger.debug(
+            "Module '%s' from '%s' source at path '%s' ignored (overridden by '%s' source)",
+            name, source, path, existing.source
+        )
+        return True
+
     def _add_module(
         self,
         name: str,
@@ -347,11 +780,13 @@ class ModuleDiscoverer:
                 name=name, path=path, source=source, spec=spec
             )
             logger.debug(
-                f"Discovered module '{name}' from '{source}' source at path '{path}'"
+                "Discovered module '%s' from '%s' source at path '%s'",
+                name, source, path
             )
         else:
             logger.debug(
-                f"Module '{name}' from '{source}' source at path '{path}' ignored (overridden by '{self.discovered_modules[name].source}' source)"
+                "Module '%s' from '%s' source at path '%s' ignored (overridden by '%s' source)",
+                name, source, path, self.discovered_modules[name].source
             )
 
     def discover(self) -> Dict[str, ModuleInfo]:
@@ -362,28 +797,181 @@ class ModuleDiscoverer:
         logger.info("Starting module discovery...")
         self.discovered_modules = {}  # Reset previous discoveries if any
 
-        # --- Priority 1: App Modules ---
-        self._discover_app_modules()
+        fingerprint = self._cache_fingerprint() if self.cache_path else None
+        cached_modules = self._load_cache(fingerprint)
+        if cached_modules is not None:
+            self.discovered_modules = cached_modules
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Module discovery loaded from cache %s: %s",
+                    self.cache_path, ", ".join(self.discovered_modules),
+                )
+            return self.discovered_modules
 
-        # --- Priority 2: Explicit Modules ---
-        self._discover_explicit_modules()
+        # Scanning installed packages is independent of the other sources, so it
+        # runs in a worker thread while the app and explicit modules are checked
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="stufio-discover") as executor:
+            installed = executor.submit(self._discover_installed_modules)
 
-        # --- Priority 3: Installed Packages ---
-        self._discover_installed_packages()
+            # --- Priority 1: App Modules ---
+            self._discover_app_modules()
 
-        logger.info(
-            f"Module discovery complete. Found {len(self.discovered_modules)} prioritized modules: {list(self.discovered_modules.keys())}"
-        )
+            # --- Priority 2: Explicit Modules ---
+            self._discover_explicit_modules()
+
+            # --- Priority 3: Installed Packages ---
+            for name, info in installed.result().items():
+                if not self._is_discovered(name, info.path, info.source):
+                    self.discovered_modules[name] = info
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Module discovery complete. Found %s prioritized modules: %s",
+                len(self.discovered_modules), ", ".join(self.discovered_modules),
+            )
+        self._write_cache(fingerprint)
         return self.discovered_modules
 
+    def _cache_fingerprint(self) -> Dict[str, Any]:
+        """
+        Builds the fingerprint a cached discovery result must match.
+        Installing, upgrading or removing packages touches a sys.path directory and
+        adding an app module touches the app modules directory, so directory mtimes
+        stand in for installed distribution versions without scanning any package
+        metadata. Adding or removing files inside a module directory only touches
+        that directory, so every candidate module directory is included too. The
+        framework version is included because it decides how modules are
+        discovered and how the cache is laid out.
+        """
+        watched = [str(self.app_modules_path), *self.watch_dirs, *sys.path, *self._candidate_dirs()]
+        mtimes = {}
+        for directory in dict.fromkeys(watched):
+            try:
+                mtimes[directory] = os.stat(directory or ".").st_mtime_ns
+            except OSError:
+                mtimes[directory] = None
+
+        return {
+            "python": sys.version,
+            "stufio": __version__,
+            "sys_path": list(sys.path),
+            "app_modules_base_import_path": self.app_modules_base_import_path,
+            "package_prefix": self.package_prefix,
+            "explicit_modules": list(self.explicit_modules),
+            "mtimes": mtimes,
+        }
+
+    def _candidate_dirs(self) -> List[str]:
+        """
+        Lists the directories discovery may find module packages in: the app
+        modules directory's subdirectories, and the package_prefix namespace
+        directories on sys.path with their subdirectories.
+        """
+        namespace = os.path.join(*self.package_prefix.strip(".").split("."))
+        roots = [str(self.app_modules_path)]
+        for entry in sys.path:
+            namespace_dir = os.path.join(entry or ".", namespace)
+            if os.path.isdir(namespace_dir):
+                roots.append(namespace_dir)
+
+        candidates = list(roots)
+        for root in roots:
+            try:
+                with os.scandir(root) as it:
+                    candidates.extend(
+                        entry.path for entry in it
+                        if entry.is_dir() and not entry.name.startswith(("__", "."))
+                    )
+            except OSError:
+                continue
+        return candidates
+
+    def _load_cache(self, fingerprint: Optional[Dict[str, Any]]) -> Optional[Dict[str, ModuleInfo]]:
+        """Loads discovered modules from the cache file if it matches the fingerprint."""
+        if not self.cache_path or fingerprint is None:
+            return None
+
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if data.get("fingerprint") != fingerprint:
+            logger.debug("Module discovery cache %s is stale", self.cache_path)
+            return None
+
+        modules = {}
+        for name, entry in data.get("modules", {}).items():
+            origin = entry.get("origin")
+            if origin:
+                # A removed or replaced package file invalidates the whole result
+                try:
+                    mtime = os.stat(origin).st_mtime_ns
+                except OSError:
+                    mtime = None
+                if mtime is None or mtime != entry.get("mtime"):
+                    logger.debug("Module discovery cache %s is stale for %s", self.cache_path, origin)
+                    return None
+
+            # Rebuild the spec from the recorded location without searching sys.path
+            spec = None
+            if origin:
+                spec = importlib.util.spec_from_file_location(
+                    entry["path"], origin, submodule_search_locations=[os.path.dirname(origin)]
+                )
+            modules[name] = ModuleInfo(
+                name=name, path=entry["path"], source=entry["source"], spec=spec
+            )
+
+        return modules
+
+    def _write_cache(self, fingerprint: Optional[Dict[str, Any]]) -> None:
+        """Stores the discovered modules in the cache file."""
+        if not self.cache_path or fingerprint is None:
+            return
+
+        modules = {}
+        for name, info in self.discovered_modules.items():
+            origin = info.spec.origin if info.spec else None
+            try:
+                mtime = os.stat(origin).st_mtime_ns if origin else None
+            except OSError:
+                mtime = None
+            modules[name] = {"path": info.path, "source": info.source, "origin": origin, "mtime": mtime}
+
+        data = {"fingerprint": fingerprint, "modules": modules}
+        try:
+            os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+            tmp_path = f"{self.cache_path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            # Atomic rename so concurrent workers never read a partial file
+            os.replace(tmp_path, self.cache_path)
+        except OSError as e:
+            logger.debug("Could not write module discovery cache %s: %s", self.cache_path, e)
+
+    def invalidate_cache(self) -> None:
+        """Removes the discovery cache file so the next discover() rescans."""
+        if not self.cache_path:
+            return
+        try:
+            os.remove(self.cache_path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning("Could not remove module discovery cache %s: %s", self.cache_path, e)
+
     def _discover_app_modules(self):
         """Scans the predefined application modules directory."""
         logger.info(
-            f"Scanning for app modules in: {self.app_modules_path} (base import: {self.app_modules_base_import_path})"
+            "Scanning for app modules in: %s (base import: %s)",
+            self.app_modules_path, self.app_modules_base_import_path
         )
-        if not self.app_modules_path.is_dir():
+        if not os.path.isdir(self.app_modules_path):
             logger.warning(
-                f"App modules directory not found or not a directory: {self.app_modules_path}"
+                "App modules directory not found or not a directory: %s",
+                self.app_modules_path
             )
             return
 
@@ -392,46 +980,77 @@ class ModuleDiscoverer:
         # Example: if base is 'app.modules', ensure directory containing 'app' is in sys.path
         # This often happens naturally if running from project root. Add checks if needed.
 
-        for item in self.app_modules_path.iterdir():
-            if item.is_dir() and (item / "__init__.py").is_file():
-                module_name = item.name
-                full_path = f"{self.app_modules_base_import_path}.{module_name}"
-                spec = None
-                try:
+        # scandir reports entry types without a stat() per directory entry
+        with os.scandir(self.app_modules_path) as it:
+            package_dirs = [
+                entry for entry in it
+                if entry.is_dir() and os.path.isfile(os.path.join(entry.path, "__init__.py"))
+            ]
+
+        # Resolve the base package once; when it is imported from this directory the
+        # module specs can be built from the known file locations directly
+        try:
+            base_spec = importlib.util.find_spec(self.app_modules_base_import_path)
+        except Exception as e:
+            logger.debug("Cannot resolve base import path %s: %s", self.app_modules_base_import_path, e)
+            base_spec = None
+        base_locations = base_spec.submodule_search_locations if base_spec else None
+        from_base = bool(base_locations) and any(
+            os.path.realpath(location) == str(self.app_modules_path) for location in base_locations
+        )
+
+        for entry in package_dirs:
+            module_name = entry.name
+            full_path = f"{self.app_modules_base_import_path}.{module_name}"
+            spec = None
+            try:
+                if from_base:
+                    spec = importlib.util.spec_from_file_location(
+                        full_path,
+                        os.path.join(entry.path, "__init__.py"),
+                        submodule_search_locations=[entry.path],
+                    )
+                else:
                     # Verify it's findable before adding
                     spec = importlib.util.find_spec(full_path)
-                    if spec is None:
-                        logger.warning(
-                            f"App module '{module_name}' found in filesystem but cannot be imported via path '{full_path}'. Check sys.path and base import path."
-                        )
-                        continue
-                    self._add_module(
-                        name=module_name, path=full_path, source="app", spec=spec
+                if spec is None:
+                    logger.warning(
+                        "App module '%s' found in filesystem but cannot be imported via path '%s'. Check sys.path and base import path.",
+                        module_name, full_path
                     )
-                except Exception as e:
-                    logger.error(f"Error checking app module spec for {full_path}: {e}")
+                    continue
+                self._add_module(
+                    name=module_name, path=full_path, source="app", spec=spec
+                )
+            except Exception as e:
+                logger.error("Error checking app module spec for %s: %s", full_path, e)
 
     def _discover_explicit_modules(self):
         """Processes the explicitly defined list of module paths."""
-        logger.info(f"Checking explicit modules: {self.explicit_modules}")
+        logger.info("Checking explicit modules: %s", self.explicit_modules)
         for module_path in self.explicit_modules:
             module_name = self._get_short_name(module_path)
             if not module_name:
                 logger.warning(
-                    f"Could not determine short name for explicit module path: {module_path}"
+                    "Could not determine short name for explicit module path: %s",
+                    module_path
                 )
                 continue
+            if self._is_discovered(module_name, module_path, "explicit"):
+                continue
 
             try:
                 spec = importlib.util.find_spec(module_path)
                 if spec is None:
                     logger.warning(
-                        f"Explicit module specified but not found: {module_path}"
+                        "Explicit module specified but not found: %s",
+                        module_path
                     )
                     continue
                 if spec.origin is None or not spec.origin.endswith("__init__.py"):
                     logger.warning(
-                        f"Explicit module path '{module_path}' does not point to a package (__init__.py not found or namespace package)."
+                        "Explicit module path '%s' does not point to a package (__init__.py not found or namespace package).",
+                        module_path
                     )
                     # Decide whether to allow non-package modules if needed
                     # continue # Uncomment to strictly enforce packages
@@ -440,15 +1059,50 @@ class ModuleDiscoverer:
                     name=module_name, path=module_path, source="explicit", spec=spec
                 )
             except Exception as e:
-                logger.error(f"Error checking explicit module {module_path}: {e}")
+                logger.error("Error checking explicit module %s: %s", module_path, e)
+
+    def _discover_installed_modules(self) -> Dict[str, ModuleInfo]:
+        """Runs the installed packages scan on its own result dict and returns it."""
+        discoverer = copy.copy(self)
+        discoverer.discovered_modules = {}
+        discoverer._discover_installed_packages()
+        return discoverer.discovered_modules
+
+    def _discover_entry_points(self) -> int:
+        """
+        Adds installed modules declared in the ENTRY_POINT_GROUP entry point group.
+        Returns the number of declared entry points, including overridden ones.
+        """
+        entry_points = _module_entry_points(tuple(sys.path), self.ENTRY_POINT_GROUP)
+        for name, module_path in entry_points:
+            if self._is_discovered(name, module_path, "installed"):
+                continue
+            try:
+                spec = importlib.util.find_spec(module_path)
+            except Exception as e:
+                logger.error("Error checking entry point module %s: %s", module_path, e)
+                continue
+            if spec is None:
+                logger.warning("Entry point module declared but not found: %s", module_path)
+                continue
+            self._add_module(name=name, path=module_path, source="installed", spec=spec)
+
+        if entry_points:
+            logger.info(
+                "Found %s modules in entry point group %s",
+                len(entry_points), self.ENTRY_POINT_GROUP
+            )
+        return len(entry_points)
 
     def _discover_installed_packages(self):
-        """Scans installed packages matching the defined prefix."""
-        # Import these at the beginning of the function
-        import sys
-        # No need to re-import importlib, use the one from module scope
-        
-        logger.info(f"Scanning for installed modules with prefix: {self.package_prefix}")
+        """
+        Scans installed packages: modules declared as entry points first, then
+        packages matching the defined prefix, so packages that do not declare an
+        entry point yet are still found next to those that do.
+        """
+        self._discover_entry_points()
+
+        logger.info("Scanning for installed modules with prefix: %s", self.package_prefix)
         modules_found = 0
         
         try:
@@ -457,7 +1111,7 @@ class ModuleDiscoverer:
             spec = importlib.util.find_spec(base_package_path)
             
             if spec and spec.submodule_search_locations:
-                logger.debug(f"Found submodule_search_locations: {spec.submodule_search_locations}")
+                logger.debug("Found submodule_search_locations: %s", spec.submodule_search_locations)
                 # Iterate through modules within the package(s) found
                 for finder, name, ispkg in pkgutil.iter_modules(
                     spec.submodule_search_locations, prefix=self.package_prefix
@@ -466,9 +1120,14 @@ class ModuleDiscoverer:
                         module_name = self._get_short_name(name)
                         if not module_name:
                             continue  # Skip if name invalid
+                        if self._is_discovered(module_name, name, "installed"):
+                            continue
                         
-                        # Re-verify spec for the specific submodule found by pkgutil
-                        sub_spec = importlib.util.find_spec(name)
+                        # The path entry finder pkgutil used already knows the location
+                        find_spec = getattr(finder, "find_spec", None)
+                        sub_spec = find_spec(name) if find_spec else None
+                        if sub_spec is None:
+                            sub_spec = importlib.util.find_spec(name)
                         self._add_module(
                             name=module_name,
                             path=name,
@@ -477,71 +1136,79 @@ class ModuleDiscoverer:
                         )
                         modules_found += 1
             else:
-                logger.debug(f"No submodule_search_locations found for {base_package_path}")
+                logger.debug("No submodule_search_locations found for %s", base_package_path)
             
             # Method 2: Check existing imports in sys.modules
-            for module_name in list(sys.modules.keys()):
-                if module_name.startswith(self.package_prefix) and "." not in module_name[len(self.package_prefix):]:
-                    short_name = self._get_short_name(module_name)
-                    try:
-                        sub_spec = importlib.util.find_spec(module_name)
+            # Filter in one pass over a snapshot of the keys: the lookups below and
+            # imports in other threads can add entries while we iterate
+            prefix = self.package_prefix
+            prefix_len = len(prefix)
+            imported_modules = [
+                name for name in list(sys.modules)
+                if name.startswith(prefix) and name.find(".", prefix_len) == -1
+            ]
+            for module_name in imported_modules:
+                short_name = self._get_short_name(module_name)
+                if self._is_discovered(short_name, module_name, "installed"):
+                    continue
+                try:
+                    sub_spec = importlib.util.find_spec(module_name)
+                    self._add_module(
+                        name=short_name,
+                        path=module_name,
+                        source="installed",
+                        spec=sub_spec,
+                    )
+                    modules_found += 1
+                except Exception as e:
+                    logger.debug("Error adding module from sys.modules %s: %s", module_name, e)
+            
+            # Method 3: Scan installed package distributions
+            # Module distributions install into the namespace walked by Method 1, so
+            # reading every distribution's metadata only pays off as a fallback
+            if modules_found:
+                logger.debug("Skipping distribution scan, namespace scan found the installed modules")
+                dist_names = ()
+            else:
+                dist_names = _module_distribution_names(tuple(sys.path), self.DISTRIBUTION_PREFIXES)
+            for dist_name in dist_names:
+                # stufio-modules-my-events / stufio.modules.my-events -> my_events
+                short_name = (
+                    dist_name.removeprefix("stufio-modules-")
+                    .removeprefix("stufio.modules.")
+                    .translate(_DIST_TO_MODULE_NAME)
+                )
+                if not short_name:
+                    continue
+                module_path = f"{self.package_prefix}{short_name}"
+
+                if self._is_discovered(short_name, module_path, "installed"):
+                    continue
+                
+                try:
+                    # Try to find the spec
+                    logger.debug("Trying to find spec for module path: %s", module_path)
+                    sub_spec = importlib.util.find_spec(module_path)
+                    if sub_spec:
                         self._add_module(
                             name=short_name,
-                            path=module_name,
+                            path=module_path,
                             source="installed",
                             spec=sub_spec,
                         )
                         modules_found += 1
-                    except Exception as e:
-                        logger.debug(f"Error adding module from sys.modules {module_name}: {e}")
-            
-            # Method 3: Scan installed package distributions
-            for dist in importlib.metadata.distributions():
-                # Check for both direct modules and hyphenated package names
-                dist_name = dist.metadata["Name"]
-                if (dist_name.startswith("stufio-modules-") or 
-                    dist_name.startswith("stufio.modules.")):
-                    
-                    # Convert hyphenated name to dotted import path if needed
-                    if "-" in dist_name:
-                        # stufio-modules-events -> stufio.modules.events
-                        module_path = dist_name.replace("-", ".")
+                        logger.debug("Successfully found module: %s", module_path)
                     else:
-                        module_path = dist_name
-                    
-                    # For hyphenated packages, get just the last part (e.g., 'events')
-                    if dist_name.startswith("stufio-modules-"):
-                        short_name = dist_name.split("-")[-1]
-                    else:
-                        short_name = self._get_short_name(module_path)
-                    
-                    # Ensure we're using the correct import path
-                    if not module_path.startswith(self.package_prefix):
-                        module_path = f"{self.package_prefix}{short_name}"
-                    
-                    try:
-                        # Try to find the spec
-                        logger.debug(f"Trying to find spec for module path: {module_path}")
-                        sub_spec = importlib.util.find_spec(module_path)
-                        if sub_spec:
-                            self._add_module(
-                                name=short_name,
-                                path=module_path,
-                                source="installed",
-                                spec=sub_spec,
-                            )
-                            modules_found += 1
-                            logger.debug(f"Successfully found module: {module_path}")
-                        else:
-                            logger.debug(f"Could not find spec for path: {module_path}")
-                    except Exception as e:
-                        logger.debug(f"Error processing package {dist_name}: {e}")
-            
-            logger.info(f"Found {modules_found} installed modules with prefix {self.package_prefix}")
+                        logger.debug("Could not find spec for path: %s", module_path)
+                except Exception as e:
+                    logger.debug("Error processing package %s: %s", dist_name, e)
+        
+            logger.info("Found %s installed modules with prefix %s", modules_found, self.package_prefix)
             
         except Exception as e:
             logger.error(
-                f"Error scanning installed packages with prefix {self.package_prefix}: {e}",
+                "Error scanning installed packages with prefix %s: %s",
+                self.package_prefix, e,
                 exc_info=True,
             )
 
@@ -552,8 +1219,25 @@ class ModuleInterface:
     # Module metadata
     name: str = None
     version: str = "0.0.0"
+    depends_on: Tuple[str, ...] = ()  # Names of modules that must be registered first
     _routes_prefix: str = None
     _module_info: Optional[ModuleInfo] = None
+    _default_name: str = "moduleinterface"  # Derived from the class name in __init_subclass__
+
+    # Subclasses in definition order, indexed by their module and every parent package,
+    # used by ModuleRegistry to find a module's interface without scanning
+    _subclasses: ClassVar[Dict[str, List[type]]] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        package = None
+        for part in cls.__module__.split("."):
+            package = f"{package}.{part}" if package else part
+            ModuleInterface._subclasses.setdefault(package, []).append(cls)
+
+        # Name used when neither the class nor the ModuleInfo provides one
+        cls_name = cls.__name__
+        cls._default_name = (cls_name[:-6] if cls_name.endswith("Module") else cls_name).lower()
     
     def __init__(self, module_info: Optional[ModuleInfo] = None):
         # Store ModuleInfo if provided
@@ -561,14 +1245,11 @@ class ModuleInterface:
         
         # Auto-determine module name from class name if not provided
         if not self.name:
-            if self._module_info:
-                self.name = self._module_info.name
-            else:
-                cls_name = self.__class__.__name__
-                if (cls_name.endswith("Module")):
-                    self.name = cls_name[:-6].lower()
-                else:
-                    self.name = cls_name.lower()
+            self.name = self._module_info.name if self._module_info else self._default_name
+
+        # Resolve the routes prefix once instead of on every routes_prefix access
+        if not self._routes_prefix:
+            self._routes_prefix = getattr(get_settings(), "API_V1_STR", "/api/v1")
     
     @property
     def module_path(self) -> Optional[str]:
@@ -590,9 +1271,9 @@ class ModuleInterface:
             # Call register_routes by default
             self.register_routes(app)
         except NotImplementedError:
-            logger.warning(f"Module {self.name} does not implement register_routes")
+            logger.warning("Module %s does not implement register_routes", self.name)
         except Exception as e:
-            logger.error(f"Error registering routes for module {self.name}: {str(e)}", exc_info=True)
+            logger.error("Error registering routes for module %s: %s", self.name, e, exc_info=True)
             
     def unregister(self, app: 'StufioAPI') -> None:
         """Unregister this module from the FastAPI app."""
@@ -618,11 +1299,8 @@ class ModuleInterface:
     def routes_prefix(self) -> str:
         """Get the routes prefix for this module."""
         if not self._routes_prefix:
-            settings = get_settings()
-            api_prefix = getattr(settings, "API_V1_STR", "/api/v1")
-
-            self._routes_prefix = api_prefix
-
+            # Subclasses that override __init__ without calling super()
+            self._routes_prefix = getattr(get_settings(), "API_V1_STR", "/api/v1")
         return self._routes_prefix
 
     def get_submodule(self, submodule_path: str):
@@ -635,7 +1313,7 @@ class ModuleInterface:
             The imported submodule or None if not found
         """
         if not self._module_info:
-            logger.warning(f"Cannot load submodule '{submodule_path}' for module '{self.name}': no module info available")
+            logger.warning("Cannot load submodule '%s' for module '%s': no module info available", submodule_path, self.name)
             return None
             
         return self._module_info.get_submodule(submodule_path)
@@ -1,15 +1,21 @@
 """
 OAuth utilities for Google and Apple authentication
 """
+from __future__ import annotations
+
+import asyncio
+import importlib.util
 import json
 import logging
-from typing import Optional, Dict, Any
-from datetime import datetime, timezone
-import jwt
-from jwt.algorithms import RSAAlgorithm
-import requests
-from google.auth.transport import requests as google_requests
-from google.oauth2 import id_token
+import time
+from functools import partial
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Optional, Tuple
+
+try:
+    # orjson decodes faster; json.loads is the fallback when it is not installed
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
 
 from stufio.core.config import get_settings
 from stufio.schemas.oauth import GoogleUserInfo, AppleUserInfo, OAuthUserInfo
@@ -18,13 +24,147 @@ logger = logging.getLogger(__name__)
 settings = get_settings()
 
 
+# The JWT, crypto and HTTP libraries are only needed once a user signs in with
+# a provider, so they are imported inside the functions that use them
+if TYPE_CHECKING:
+    import httpx
+
+# Shared client for OAuth provider calls, so logins reuse pooled connections
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Return the shared OAuth HTTP client, creating it on first use"""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        import httpx
+
+        _http_client = httpx.AsyncClient(
+            # HTTP/2 needs the optional h2 package (httpx[http2])
+            http2=importlib.util.find_spec("h2") is not None,
+            timeout=5.0,
+            limits=httpx.Limits(max_keepalive_connections=20),
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared OAuth HTTP client; call on application shutdown"""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
 class OAuthError(Exception):
     """Base exception for OAuth-related errors"""
     pass
 
 
+class _JWKSCache:
+    """
+    Cached JSON Web Key Set of an OAuth provider
+    
+    The key set is reused for ttl seconds and each JWK is converted to an RSA
+    public key once. A token naming an unknown key ID refetches the key set, at
+    most once every min_refresh seconds.
+    """
+
+    def __init__(self, provider: str, url: str, ttl: float = 3600, min_refresh: float = 60):
+        self.provider = provider
+        self.url = url
+        self.ttl = ttl
+        self.min_refresh = min_refresh
+        # Key set with its fetch time, and the RSA keys parsed from it by key ID
+        self._keys: Optional[Tuple[float, Dict[str, Any]]] = None
+        self._rsa_keys: Dict[str, Any] = {}
+        self._lock: Optional[asyncio.Lock] = None
+
+    async def get_keys(self, force_refresh: bool = False) -> Dict[str, Any]:
+        """
+        Fetch the provider's public keys in JWKS format
+        
+        Args:
+            force_refresh: If True, refetch the keys unless they were fetched
+                less than min_refresh seconds ago
+        
+        Raises:
+            OAuthError: If key fetching fails
+        """
+        max_age = self.min_refresh if force_refresh else self.ttl
+        cached = self._keys
+        if cached and time.monotonic() - cached[0] < max_age:
+            return cached[1]
+
+        # Created lazily so the lock belongs to the running event loop
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        async with self._lock:
+            # Another request may have fetched the keys while we were waiting
+            cached = self._keys
+            if cached and time.monotonic() - cached[0] < max_age:
+                return cached[1]
+
+            import httpx
+
+            try:
+                response = await _get_http_client().get(self.url)
+                response.raise_for_status()
+                keys_data = json_loads(response.content)
+
+            except httpx.HTTPError as e:
+                logger.error(f"Failed to fetch {self.provider} public keys: {str(e)}")
+                raise OAuthError(f"Failed to fetch {self.provider} public keys: {str(e)}")
+
+            self._keys = (time.monotonic(), keys_data)
+            # Keys the provider no longer publishes must not outlive the set they came from
+            self._rsa_keys = {}
+            return keys_data
+
+    async def get_key(self, kid: str) -> Any:
+        """
+        Get the RSA public key for a key ID
+        
+        Args:
+            kid: Key ID from the token header
+            
+        Returns:
+            RSAPublicKey: Public key to verify the token signature with
+            
+        Raises:
+            OAuthError: If no public key has this key ID
+        """
+        keys_data = await self.get_keys()
+        public_key = self._rsa_keys.get(kid)
+        if public_key is not None:
+            return public_key
+
+        public_key_jwk = next((key for key in keys_data.get('keys', []) if key.get('kid') == kid), None)
+        if not public_key_jwk:
+            # The provider may have rotated its keys since the cached fetch
+            keys_data = await self.get_keys(force_refresh=True)
+            public_key_jwk = next((key for key in keys_data.get('keys', []) if key.get('kid') == kid), None)
+
+        if not public_key_jwk:
+            raise OAuthError(f"Public key not found for key ID: {kid}")
+
+        import jwt
+
+        # Convert JWK to RSA public key object
+        public_key = jwt.algorithms.RSAAlgorithm.from_jwk(public_key_jwk)
+        self._rsa_keys[kid] = public_key
+        return public_key
+
+
 class GoogleOAuthVerifier:
     """Google OAuth ID token verification"""
+
+    GOOGLE_KEYS_URL = "https://www.googleapis.com/oauth2/v3/certs"
+    GOOGLE_ISSUERS = ('accounts.google.com', 'https://accounts.google.com')
+
+    # Google's public keys, fetched through the shared HTTP client
+    _jwks = _JWKSCache("Google", GOOGLE_KEYS_URL)
     
     @staticmethod
     async def verify_id_token(token: str) -> GoogleUserInfo:
@@ -40,21 +180,30 @@ class GoogleOAuthVerifier:
         Raises:
             OAuthError: If token verification fails
         """
+        import jwt
+
         try:
             # Get Google client ID from settings
             google_client_id = getattr(settings, 'GOOGLE_CLIENT_ID', None)
             if not google_client_id:
                 raise OAuthError("Google client ID not configured")
             
-            # Verify the token
-            idinfo = id_token.verify_oauth2_token(
-                token, 
-                google_requests.Request(), 
-                google_client_id
+            # Get the matching Google public key
+            kid = jwt.get_unverified_header(token).get('kid')
+            if not kid:
+                raise OAuthError("No key ID found in Google ID token header")
+            public_key = await GoogleOAuthVerifier._jwks.get_key(kid)
+            
+            # Verify the token signature, expiry and audience
+            idinfo = jwt.decode(
+                token,
+                public_key,  # type: ignore - PyJWT accepts RSAPublicKey objects
+                algorithms=['RS256'],
+                audience=google_client_id,
             )
             
             # Check if token is from correct issuer
-            if idinfo['iss'] not in ['accounts.google.com', 'https://accounts.google.com']:
+            if idinfo.get('iss') not in GoogleOAuthVerifier.GOOGLE_ISSUERS:
                 raise OAuthError("Invalid token issuer")
             
             # Extract user information
@@ -68,7 +217,7 @@ class GoogleOAuthVerifier:
             logger.info(f"Successfully verified Google ID token for user: {user_info.email}")
             return user_info
             
-        except ValueError as e:
+        except jwt.InvalidTokenError as e:
             logger.error(f"Google ID token verification failed: {str(e)}")
             raise OAuthError(f"Invalid Google ID token: {str(e)}")
         except Exception as e:
@@ -81,12 +230,26 @@ class AppleOAuthVerifier:
 
     APPLE_TOKEN_URL = "https://appleid.apple.com/auth/token"
     APPLE_KEYS_URL = "https://appleid.apple.com/auth/keys"
+    APPLE_KEYS_TTL = 3600  # Seconds Apple's public keys are reused before refetching
+    APPLE_KEYS_MIN_REFRESH = 60  # Minimum seconds between refetches for unknown key IDs
+    APPLE_CLIENT_SECRET_TTL = 3000  # Seconds a client secret is reused (it expires after 3600)
+
+    # Apple's public keys, fetched through the shared HTTP client
+    _jwks = _JWKSCache("Apple", APPLE_KEYS_URL, APPLE_KEYS_TTL, APPLE_KEYS_MIN_REFRESH)
+
+    # Signed client secrets with their creation time by use_ios_config, and
+    # loaded private keys by file path
+    _client_secret_cache: Dict[bool, Tuple[float, str]] = {}
+    _private_keys: Dict[str, Any] = {}
 
     @staticmethod
     def _create_client_secret(use_ios_config: bool = False) -> str:
         """
         Create client secret JWT for Apple OAuth
         
+        The signed secret is reused for APPLE_CLIENT_SECRET_TTL seconds and the
+        private key file is read and parsed only once.
+        
         Args:
             use_ios_config: If True, use iOS configuration, otherwise use web configuration
         
@@ -96,6 +259,13 @@ class AppleOAuthVerifier:
         Raises:
             OAuthError: If client secret creation fails
         """
+        cached = AppleOAuthVerifier._client_secret_cache.get(use_ios_config)
+        if cached and time.monotonic() - cached[0] < AppleOAuthVerifier.APPLE_CLIENT_SECRET_TTL:
+            return cached[1]
+
+        import jwt
+        from cryptography.hazmat.primitives import serialization
+
         try:
             # Get Apple configuration from settings
             if use_ios_config:
@@ -112,22 +282,22 @@ class AppleOAuthVerifier:
             if not all([team_id, key_id, client_id, private_key_path]):
                 raise OAuthError("Apple OAuth configuration incomplete")
 
-            # Read private key
-            try:
-                if private_key_path:
-                    with open(private_key_path, 'r') as f:
-                        private_key = f.read()
-                else:
-                    raise OAuthError("Apple private key path not configured")
-            except FileNotFoundError:
-                raise OAuthError(f"Apple private key file not found: {private_key_path}")
+            # Load private key
+            private_key = AppleOAuthVerifier._private_keys.get(private_key_path)
+            if private_key is None:
+                try:
+                    with open(private_key_path, 'rb') as f:
+                        private_key = serialization.load_pem_private_key(f.read(), password=None)
+                except FileNotFoundError:
+                    raise OAuthError(f"Apple private key file not found: {private_key_path}")
+                AppleOAuthVerifier._private_keys[private_key_path] = private_key
 
             # Create JWT payload
-            now = datetime.now(timezone.utc)
+            iat = int(time.time())
             payload = {
                 'iss': team_id,
-                'iat': int(now.timestamp()),
-                'exp': int(now.timestamp()) + 3600,  # 1 hour expiration
+                'iat': iat,
+                'exp': iat + 3600,  # 1 hour expiration
                 'aud': 'https://appleid.apple.com',
                 'sub': client_id,
             }
@@ -140,6 +310,7 @@ class AppleOAuthVerifier:
                 headers={'kid': key_id}
             )
 
+            AppleOAuthVerifier._client_secret_cache[use_ios_config] = (time.monotonic(), client_secret)
             return client_secret
 
         except Exception as e:
@@ -161,6 +332,8 @@ class AppleOAuthVerifier:
         Raises:
             OAuthError: If token exchange fails
         """
+        import httpx
+
         try:
             client_secret = AppleOAuthVerifier._create_client_secret(use_ios_config)
             
@@ -187,41 +360,21 @@ class AppleOAuthVerifier:
                 'redirect_uri': redirect_uri
             }
 
-            response = requests.post(AppleOAuthVerifier.APPLE_TOKEN_URL, data=data)
+            response = await _get_http_client().post(AppleOAuthVerifier.APPLE_TOKEN_URL, data=data)
 
             if response.status_code != 200:
                 logger.error(f"Apple token exchange failed: {response.status_code} {response.text}")
                 raise OAuthError(f"Apple token exchange failed: {response.status_code}")
 
-            return response.json()
+            return json_loads(response.content)
 
-        except requests.RequestException as e:
+        except httpx.HTTPError as e:
             logger.error(f"Network error during Apple token exchange: {str(e)}")
             raise OAuthError(f"Apple token exchange network error: {str(e)}")
         except Exception as e:
             logger.error(f"Unexpected error during Apple token exchange: {str(e)}")
             raise OAuthError(f"Apple token exchange failed: {str(e)}")
 
-    @staticmethod
-    async def _get_apple_public_keys() -> Dict[str, Any]:
-        """
-        Fetch Apple's public keys for JWT verification
-        
-        Returns:
-            Dict: Apple's public keys in JWKS format
-            
-        Raises:
-            OAuthError: If key fetching fails
-        """
-        try:
-            response = requests.get(AppleOAuthVerifier.APPLE_KEYS_URL)
-            response.raise_for_status()
-            return response.json()
-
-        except requests.RequestException as e:
-            logger.error(f"Failed to fetch Apple public keys: {str(e)}")
-            raise OAuthError(f"Failed to fetch Apple public keys: {str(e)}")
-
     @staticmethod
     async def _verify_id_token(id_token_str: str, use_ios_config: bool = False) -> Dict[str, Any]:
         """
@@ -237,10 +390,9 @@ class AppleOAuthVerifier:
         Raises:
             OAuthError: If token verification fails
         """
+        import jwt
+
         try:
-            # Get Apple's public keys
-            keys_data = await AppleOAuthVerifier._get_apple_public_keys()
-            
             # Get the key ID from the token header
             unverified_header = jwt.get_unverified_header(id_token_str)
             kid = unverified_header.get('kid')
@@ -248,16 +400,6 @@ class AppleOAuthVerifier:
             if not kid:
                 raise OAuthError("No key ID found in Apple ID token header")
             
-            # Find the matching public key JWK
-            public_key_jwk = None
-            for key in keys_data.get('keys', []):
-                if key.get('kid') == kid:
-                    public_key_jwk = key
-                    break
-            
-            if not public_key_jwk:
-                raise OAuthError(f"Public key not found for key ID: {kid}")
-            
             # Get client ID for audience validation
             if use_ios_config:
                 client_id = getattr(settings, 'APPLE_IOS_CLIENT_ID', None)
@@ -268,8 +410,22 @@ class AppleOAuthVerifier:
                 if not client_id:
                     raise OAuthError("Apple client ID not configured")
             
-            # Convert JWK to RSA public key object
-            public_key = RSAAlgorithm.from_jwk(public_key_jwk)
+            # Reject expired or misdirected tokens before the key lookup and
+            # signature check; the claims are verified again with the signature
+            jwt.decode(
+                id_token_str,
+                options={
+                    'verify_signature': False,
+                    'verify_exp': True,
+                    'verify_aud': True,
+                    'verify_iss': True,
+                },
+                audience=client_id,
+                issuer='https://appleid.apple.com'
+            )
+            
+            # Get the matching Apple public key
+            public_key = await AppleOAuthVerifier._jwks.get_key(kid)
             
             # Verify the token with the RSA public key
             decoded_token = jwt.decode(
@@ -343,7 +499,7 @@ class AppleOAuthVerifier:
             full_name = None
             if user_data:
                 try:
-                    user_info = json.loads(user_data)
+                    user_info = json_loads(user_data)
                     name_info = user_info.get('name', {})
                     if isinstance(name_info, dict):
                         first_name = name_info.get('firstName', '')
@@ -368,6 +524,42 @@ class AppleOAuthVerifier:
             raise OAuthError(f"Apple authentication failed: {str(e)}")
 
 
+async def _verify_google(
+    token: Optional[str],
+    authorization_code: Optional[str],
+    identity_token: Optional[str],
+    user_data: Optional[str],
+) -> OAuthUserInfo:
+    """Verify a Google sign-in from its ID token"""
+    if not token:
+        raise OAuthError("Google OAuth requires ID token")
+    return await GoogleOAuthVerifier.verify_id_token(token)
+
+
+async def _verify_apple(
+    token: Optional[str],
+    authorization_code: Optional[str],
+    identity_token: Optional[str],
+    user_data: Optional[str],
+    use_ios_config: bool = False,
+) -> OAuthUserInfo:
+    """Verify an Apple sign-in from its authorization code"""
+    if not authorization_code:
+        platform = "Apple iOS" if use_ios_config else "Apple"
+        raise OAuthError(f"{platform} OAuth requires authorization code")
+    return await AppleOAuthVerifier.verify_authorization_code(
+        authorization_code, identity_token, user_data, use_ios_config=use_ios_config
+    )
+
+
+# Verification handler for each supported provider
+_PROVIDERS: Dict[str, Callable[..., Awaitable[OAuthUserInfo]]] = {
+    'google': _verify_google,
+    'apple': partial(_verify_apple, use_ios_config=False),
+    'apple_ios': partial(_verify_apple, use_ios_config=True),
+}
+
+
 async def verify_oauth_provider(
     provider: str, 
     token: Optional[str] = None,
@@ -391,24 +583,7 @@ async def verify_oauth_provider(
     Raises:
         OAuthError: If verification fails
     """
-    if provider == 'google':
-        if not token:
-            raise OAuthError("Google OAuth requires ID token")
-        return await GoogleOAuthVerifier.verify_id_token(token)
-    
-    elif provider == 'apple':
-        if not authorization_code:
-            raise OAuthError("Apple OAuth requires authorization code")
-        return await AppleOAuthVerifier.verify_authorization_code(
-            authorization_code, identity_token, user_data, use_ios_config=False
-        )
-    
-    elif provider == 'apple_ios':
-        if not authorization_code:
-            raise OAuthError("Apple iOS OAuth requires authorization code")
-        return await AppleOAuthVerifier.verify_authorization_code(
-            authorization_code, identity_token, user_data, use_ios_config=True
-        )
-    
-    else:
+    handler = _PROVIDERS.get(provider)
+    if handler is None:
         raise OAuthError(f"Unsupported OAuth provider: {provider}")
+    return await handler(token, authorization_code, identity_token, user_data)
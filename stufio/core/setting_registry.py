@@ -24,15 +24,23 @@ class SettingRegistry:
             cls._instance._settings = {}
             cls._instance._groups = {}
             cls._instance._subgroups = {}
+            # Indexes so filtered lookups don't scan every entry
+            cls._instance._settings_by_module = {}
+            cls._instance._subgroups_by_group = {}
+            cls._instance._sorted_subgroups = {}
+            cls._instance._sorted_groups = None
         return cls._instance
 
     def register_setting(self, setting: SettingMetadata):
         """Register a setting metadata"""
-        self._settings[f"{setting.module}.{setting.key}"] = setting
+        key = f"{setting.module}.{setting.key}"
+        self._settings[key] = setting
+        self._settings_by_module.setdefault(setting.module, {})[key] = setting
 
     def register_group(self, group: GroupMetadata):
         """Register a group metadata"""
         self._groups[group.id] = group
+        self._sorted_groups = None
 
     def register_subgroup(
         self, subgroup: SubgroupMetadata
@@ -42,30 +50,35 @@ class SettingRegistry:
         if not _group:
             raise ValueError(f"Group {subgroup.group_id} not found for subgroup {subgroup.id}")
 
-        self._subgroups[f"{subgroup.group_id}.{subgroup.id}"] = subgroup
+        key = f"{subgroup.group_id}.{subgroup.id}"
+        self._subgroups[key] = subgroup
+        self._subgroups_by_group.setdefault(subgroup.group_id, {})[key] = subgroup
+        self._sorted_subgroups.pop(subgroup.group_id, None)
 
     def get_settings(self, module: str = None) -> List[SettingMetadata]:
         """Get all settings, optionally filtered by module"""
         if module:
-            return [s for k, s in self._settings.items() if s.module == module]
+            return list(self._settings_by_module.get(module, {}).values())
         return list(self._settings.values())
 
     def get_groups(self) -> List[GroupMetadata]:
         """Get all groups, optionally filtered by module"""
-        return sorted(list(self._groups.values()), key=lambda g: g.order)
+        if self._sorted_groups is None:
+            self._sorted_groups = sorted(self._groups.values(), key=lambda g: g.order)
+        return list(self._sorted_groups)
 
     def get_subgroups(
         self, group_id: str
     ) -> List[SubgroupMetadata]:
         """Get all subgroups for a group"""
-        return sorted(
-            [
-                sg
-                for k, sg in self._subgroups.items()
-                if k.startswith(f"{group_id}.")
-            ],
-            key=lambda sg: sg.order,
-        )
+        subgroups = self._sorted_subgroups.get(group_id)
+        if subgroups is None:
+            subgroups = sorted(
+                self._subgroups_by_group.get(group_id, {}).values(),
+                key=lambda sg: sg.order,
+            )
+            self._sorted_subgroups[group_id] = subgroups
+        return list(subgroups)
 
 
 # Singleton instance
@@ -74,4 +87,4 @@ settings_registry = SettingRegistry()
 
 def get_setting_registry() -> SettingRegistry:
     """Get the setting registry singleton"""
-    return SettingRegistry()
+    return settings_registry
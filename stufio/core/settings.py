@@ -1,10 +1,14 @@
-from typing import Any, Dict, ClassVar, Type, Optional
-from pydantic import ConfigDict, Field
+from typing import Any, Dict, ClassVar, Set, Tuple, Type, Optional
+from pydantic import ConfigDict, Field, PrivateAttr, field_validator
 from pydantic_settings import BaseSettings
 
 
 class ModuleSettings(BaseSettings):
     """Base class for module settings with proper env variable support."""
+
+    # Bumped on every assignment to any module settings object, so cached
+    # views of them (see BaseStufioSettings.dict) can tell they changed
+    _writes: ClassVar[int] = 0
     
     # Add module_name as a proper field with default=None
     module_name: Optional[str] = Field(default=None, exclude=True)
@@ -27,19 +31,47 @@ class ModuleSettings(BaseSettings):
         # Initialize with all values
         super().__init__(**kwargs)
 
+    def __setattr__(self, name: str, value: Any):
+        ModuleSettings._writes += 1
+        super().__setattr__(name, value)
+
 
 class BaseStufioSettings(BaseSettings):
 
     # Registry of module settings classes - not an actual field
     _module_settings_registry: ClassVar[Dict[str, Type[ModuleSettings]]] = {}
 
+    # {module}_{SETTING} names resolved to (module, setting), so __getattr__ can
+    # skip the name parsing
+    _module_attr_names: ClassVar[Dict[str, Tuple[str, str]]] = {}
+
+    # Bumped whenever a module's settings are registered; dict() results cached
+    # under an older generation are rebuilt
+    _modules_generation: ClassVar[int] = 0
+    # (generations, modules entries, result) of the last plain dict() call
+    _flat_dict_cache: Optional[Tuple[Tuple[int, int], Tuple[Tuple[str, Any], ...], Dict[str, Any]]] = (
+        PrivateAttr(default=None)
+    )
+
+    # Names this instance failed to resolve, under the generation they missed in;
+    # they depend on the instance's own modules, so they are not shared
+    _missing_attr_names: Optional[Tuple[int, Set[str]]] = PrivateAttr(default=None)
+
     # Dynamic storage for module settings instances
     modules: Dict[str, Any] = {}
 
+    @field_validator("modules", mode="before")
+    @classmethod
+    def _modules_dict(cls, v: Any) -> Any:
+        """Keep modules a dict so lookups need no None checks."""
+        return {} if v is None else v
+
     @classmethod
     def register_module_settings(cls, module_name: str, settings_class: Type[ModuleSettings]):
         """Register a module's settings class."""
         cls._module_settings_registry[module_name] = settings_class
+        cls._index_module_settings(module_name, settings_class)
+        BaseStufioSettings._modules_generation += 1
         
         # If this is an instance, also initialize immediately
         if isinstance(cls, type):
@@ -53,9 +85,7 @@ class BaseStufioSettings(BaseSettings):
                 instance.modules[module_name] = module_settings
                 
                 # Also copy key settings to main settings object
-                for key, value in module_settings.model_dump().items():
-                    if key != "module_name":
-                        setattr(instance, f"{module_name}_{key}", value)
+                cls._install_module_attributes(module_name, module_settings)
             except Exception as e:
                 import logging
                 logging.getLogger(__name__).error(
@@ -67,8 +97,103 @@ class BaseStufioSettings(BaseSettings):
                 
         return settings_class
 
+    @classmethod
+    def _install_module_attributes(cls, module_name: str, module_settings: ModuleSettings):
+        """
+        Set a module's settings as {module}_{SETTING} class attributes, so reading
+        them is a plain attribute lookup that never reaches __getattr__.
+        """
+        for key, value in module_settings.model_dump().items():
+            if key != "module_name":
+                setattr(cls, f"{module_name}_{key}", value)
+
+    @classmethod
+    def _index_module_settings(cls, module_name: str, settings_class: Type[ModuleSettings]):
+        """Record the {module}_{SETTING} name of every field of a module's settings."""
+        for field_name in settings_class.model_fields:
+            if field_name != "module_name":
+                cls._module_attr_names[f"{module_name}_{field_name}"] = (module_name, field_name)
+
+    def _missing_names(self) -> Set[str]:
+        """
+        Names this instance failed to resolve since modules last changed, so
+        repeated misses (e.g. getattr with a default) skip the name parsing.
+        """
+        generation = BaseStufioSettings._modules_generation
+        entry = self._missing_attr_names
+        if entry is None or entry[0] != generation:
+            entry = self._missing_attr_names = (generation, set())
+        return entry[1]
+
+    def _get_module_settings(self, module_name: str) -> Any:
+        """
+        Get a module's settings instance, initializing it on first use if the
+        module's settings class was registered after this object was created.
+        """
+        modules = self.modules
+        if module_name not in modules and module_name in self._module_settings_registry:
+            # Get module-prefixed values from main settings
+            module_prefix = f"{module_name}_"
+            prefix_len = len(module_prefix)
+            module_settings_dict = {
+                field_name[prefix_len:]: field_value
+                for field_name, field_value in self.__dict__.items()
+                if field_name.startswith(module_prefix)
+            }
+
+            try:
+                # Initialize the module settings - include module_name as a field
+                settings_class = self._module_settings_registry[module_name]
+                module_settings = settings_class(
+                    module_name=module_name,  # This is now a proper field
+                    **module_settings_dict     # Pass values from main settings
+                )
+                modules[module_name] = module_settings
+                self._flat_dict_cache = None
+            except Exception as e:
+                # More robust error handling
+                import logging
+                logging.getLogger(__name__).error(
+                    f"Error initializing settings for module {module_name}: {e}", 
+                    exc_info=True
+                )
+                # Create empty placeholder to avoid repeated failures
+                modules[module_name] = {}
+
+        return modules.get(module_name)
+
+    def __setattr__(self, name: str, value: Any):
+        if not name.startswith("_"):
+            self._flat_dict_cache = None
+            if name == "modules":
+                self._missing_attr_names = None
+        super().__setattr__(name, value)
+
     def dict(self, *args, **kwargs):
-        """Override dict to include module settings"""
+        """
+        Override dict to include module settings.
+
+        The plain dict() result is cached and callers get a shallow copy. It is
+        rebuilt after a module is registered, a setting is assigned here or on
+        any module settings object, or an entry of modules is added or replaced.
+        """
+        if args or kwargs:
+            return self._flat_dict(*args, **kwargs)
+
+        generations = (BaseStufioSettings._modules_generation, ModuleSettings._writes)
+        entries = tuple(self.modules.items())
+        cached = self._flat_dict_cache
+        if (
+            cached is None
+            or cached[0] != generations
+            or len(cached[1]) != len(entries)
+            or any(old[0] != new[0] or old[1] is not new[1] for old, new in zip(cached[1], entries))
+        ):
+            cached = self._flat_dict_cache = (generations, entries, self._flat_dict())
+        return dict(cached[2])
+
+    def _flat_dict(self, *args, **kwargs) -> Dict[str, Any]:
+        """Build the settings dict with module settings under their prefixes."""
         result = super().dict(*args, **kwargs)
 
         # Include module settings with their prefixes
@@ -87,65 +212,41 @@ class BaseStufioSettings(BaseSettings):
 
         Also handles lazy-loading of modules registered after initialization
         """
-        # First check if attribute exists directly in object's dictionary
-        if name in self.__dict__:
-            return self.__dict__[name]
-            
-        # Or check if it's a @property or method defined on the class
-        if hasattr(self.__class__, name):
-            return getattr(self.__class__, name).__get__(self, self.__class__)
-            
-        # Check if this might be a module setting
-        if "_" in name:
-            parts = name.split("_", 1)
-            if len(parts) == 2:
-                module_name, setting_name = parts
-
-                # Initialize module settings if registered but not yet initialized
-                if module_name in self._module_settings_registry and (
-                    not hasattr(self, "modules") or 
-                    self.modules is None or 
-                    module_name not in self.modules
-                ):
-                    if not hasattr(self, "modules") or self.modules is None:
-                        self.modules = {}
-
-                    # Get module-prefixed values from main settings
-                    module_settings_dict = {}
-                    for field_name, field_value in self.__dict__.items():
-                        module_prefix = f"{module_name}_"
-                        if field_name.startswith(module_prefix):
-                            setting_name_in_dict = field_name[len(module_prefix):]
-                            module_settings_dict[setting_name_in_dict] = field_value
-
-                    try:
-                        # Initialize the module settings - include module_name as a field
-                        settings_class = self._module_settings_registry[module_name]
-                        self.modules[module_name] = settings_class(
-                            module_name=module_name,  # This is now a proper field
-                            **module_settings_dict     # Pass values from main settings
-                        )
-                    except Exception as e:
-                        # More robust error handling
-                        import logging
-                        logging.getLogger(__name__).error(
-                            f"Error initializing settings for module {module_name}: {e}", 
-                            exc_info=True
-                        )
-                        # Create empty placeholder to avoid repeated failures
-                        self.modules[module_name] = {}
-
-                # Check if this module exists in modules dict
-                if (
-                    hasattr(self, "modules")
-                    and self.modules
-                    and module_name in self.modules
-                ):
-                    module_settings = self.modules[module_name]
-
-                    # Try to access the setting from the module
-                    if hasattr(module_settings, setting_name):
-                        return getattr(module_settings, setting_name)
+        # Private and dunder names are never module settings; copy, pickle and
+        # pydantic probe these often, so leave them to pydantic right away
+        if name.startswith("_"):
+            return super().__getattr__(name)
+
+        # Known module settings resolve with a single lookup
+        target = self._module_attr_names.get(name)
+        if target is not None:
+            module_name, setting_name = target
+            module_settings = self._get_module_settings(module_name)
+            if module_settings is not None and hasattr(module_settings, setting_name):
+                return getattr(module_settings, setting_name)
+
+        elif name not in self._missing_names():
+            # First check if attribute exists directly in object's dictionary
+            if name in self.__dict__:
+                return self.__dict__[name]
+
+            # Or check if it's a @property or method defined on the class
+            if hasattr(self.__class__, name):
+                return getattr(self.__class__, name).__get__(self, self.__class__)
+
+            # Check if this might be a module setting
+            if "_" in name:
+                module_name, setting_name = name.split("_", 1)
+                module_settings = self._get_module_settings(module_name)
+
+                # Try to access the setting from the module
+                if module_settings is not None and hasattr(module_settings, setting_name):
+                    if module_name in self._module_settings_registry:
+                        self._index_module_settings(module_name, self._module_settings_registry[module_name])
+                    return getattr(module_settings, setting_name)
+
+            # Remember the miss so repeated lookups (e.g. getattr with a default) are cheap
+            self._missing_names().add(name)
 
         # Fallback to normal attribute error
         raise AttributeError(f"'StufioSettings' object has no attribute '{name}'")
@@ -1,4 +1,5 @@
 import asyncio
+import sys
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from .module_registry import ModuleRegistry, ModuleInterface
@@ -7,6 +8,18 @@ from stufio.core.config import get_settings
 import logging
 
 
+class _AppNameFilter(logging.Filter):
+    """Sets the application name on log records as ``app_name``."""
+
+    def __init__(self, app_name: str):
+        super().__init__()
+        self.app_name = app_name
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.app_name = self.app_name
+        return True
+
+
 class StufioAPI(FastAPI):
 
     def __init__(self, *args, **kwargs):
@@ -33,44 +46,31 @@ class StufioAPI(FastAPI):
             """Initialize the application with the module registry."""
             # Register all modules with the app
             self.registry.register_all_modules(app)
-            tasks = []
-            # Call on_startup for all modules
-            for module_name, module in self.registry.modules.items():
-                try:
-                    logging.info(f"Starting module: {module_name}")
-                    task = asyncio.create_task(module.on_startup(app))
-                    tasks.append(task)
-                except Exception as e:
-                    logging.error(f"Error starting module {module_name}: {str(e)}", exc_info=True)
+            # Start all modules concurrently without delaying the app startup
+            startup = asyncio.create_task(self.registry.startup_all(app))
 
             # Handle user-provided lifespan
             if self._user_lifespan:
                 # Call the user's lifespan context manager if provided
                 async with self._user_lifespan(app):
-
-                    # for task in tasks:
-                    #     await task
-
                     yield
             else:
                 # Default lifespan behavior
                 yield
 
-            # tasks = []
-            # Call on_shutdown for all modules in reverse order
-            for module_name, module in reversed(list(self.registry.modules.items())):
-                try:
-                    logging.info(f"Shutting down module: {module_name}")
-                    task = asyncio.create_task(module.on_shutdown(app))
-                    tasks.append(task)
-                except Exception as e:
-                    logging.error(f"Error shutting down module {module_name}: {str(e)}", exc_info=True)
+            # Call on_shutdown for all modules concurrently
+            shutdown = asyncio.create_task(self.registry.shutdown_all(app))
 
             # Cleanup on shutdown
             self.registry.unregister_all_modules(app)
-            
-            for task in tasks:
-                await task
+
+            await shutdown
+            await startup
+
+            # Close the shared OAuth HTTP client if this process used OAuth
+            oauth = sys.modules.get("stufio.core.oauth")
+            if oauth is not None:
+                await oauth.close_http_client()
             logging.info("All modules have been shut down.")
             # Cleanup the registry
 
@@ -83,8 +83,9 @@ class StufioAPI(FastAPI):
     def _load_modules(self):
         """Load all modules in the registry."""
         # Discover and load all modules
-        for module_name in self.registry.discover_modules():
-            self.registry.load_module(module_name)
+        self.registry.load_all(self.registry.discover_modules())
+        # Fix registration/startup order now that the module set is complete
+        self.registry.finalize()
 
     def _init_middlewares(self):
         """Initialize middleware from all modules."""
@@ -97,11 +98,18 @@ class StufioAPI(FastAPI):
         """Configure application logging."""
         # Configure error logging
         error_logger = logging.getLogger("uvicorn.error")
+        # Replace the handler of a previously created app instead of logging twice
+        for existing in error_logger.handlers[:]:
+            if existing.get_name() == "stufio":
+                error_logger.removeHandler(existing)
         handler = logging.StreamHandler()
+        handler.set_name("stufio")
+        # The app name is a record attribute, so a "%" in it cannot break the format
+        handler.addFilter(_AppNameFilter(self.app_settings.APP_NAME))
         handler.setFormatter(
             logging.Formatter(
                 "[%(asctime)s] [%(levelname)s] [%(name)s] [%(funcName)s():%(lineno)s] "
-                f"[APP:{self.app_settings.APP_NAME} PID:%(process)d TID:%(thread)d] - %(message)s"
+                "[APP:%(app_name)s PID:%(process)d TID:%(thread)d] - %(message)s"
             )
         )
         error_logger.addHandler(handler)
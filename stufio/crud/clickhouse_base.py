@@ -1,5 +1,6 @@
 import asyncio
-from typing import Generic, TypeVar, Type, Optional, Dict, Any, List, Union, Callable
+from enum import Enum
+from typing import ClassVar, Generic, TypeVar, Type, Optional, Dict, Any, List, Tuple, Union, Callable, get_args
 from fastapi.encoders import jsonable_encoder
 from pydantic import BaseModel
 from clickhouse_connect.driver.asyncclient import AsyncClient
@@ -8,20 +9,59 @@ from stufio.db.clickhouse import ClickhouseDatabase
 from stufio.core.config import get_settings
 from .base import BaseCRUD
 
-settings = get_settings()
 ModelType = TypeVar("ModelType", bound=ClickhouseBase)
 CreateSchemaType = TypeVar("CreateSchemaType", bound=BaseModel)
 UpdateSchemaType = TypeVar("UpdateSchemaType", bound=BaseModel)
 
+def _needs_validation(model: Type[BaseModel]) -> bool:
+    """
+    Check whether rows need pydantic validation to become valid model instances.
+
+    clickhouse-connect already returns datetime, date, UUID, Decimal, numbers and
+    strings for the matching column types. Enum fields (ClickHouse returns the
+    label as a string), nested models (returned as plain dicts) and
+    validators need pydantic to run.
+    """
+    decorators = model.__pydantic_decorators__
+    if decorators.field_validators or decorators.model_validators:
+        return True
+
+    annotations = [field.annotation for field in model.model_fields.values()]
+    while annotations:
+        annotation = annotations.pop()
+        if isinstance(annotation, type) and issubclass(annotation, (Enum, BaseModel)):
+            return True
+        annotations.extend(get_args(annotation))
+    return False
+
+
 class CRUDClickhouse(BaseCRUD[ModelType, CreateSchemaType, UpdateSchemaType]):
     """ClickHouse CRUD operations"""
 
+    # Rows read back from ClickHouse already match the table schema, so models are
+    # built without validation unless they need coercion (see _needs_validation);
+    # set to False to always validate, e.g. for columns stored in another type
+    # than the field's, like an int field kept in a String column
+    _trust_db_rows: ClassVar[bool] = True
+
     def __init__(self, model: Type[ModelType], client_factory: Callable[[], AsyncClient] = None):
         """Initialize with model class and optional client factory"""
         super().__init__(model)
         # Store the factory, not the instance (lazy loading)
         self._client_factory = client_factory
         self._client = None
+        # Table metadata is fixed per model, so resolve it once
+        self._table_name = model.get_table_name()
+        self._database_name = model.get_database_name()
+        self._get_sql = f"""
+            SELECT *
+            FROM {self._table_name}
+            WHERE id = {{id:String}}
+            LIMIT 1
+            """
+        # get_multi SQL (without LIMIT/OFFSET) by filter keys and sort
+        self._query_cache: Dict[Tuple, str] = {}
+        self._validate_rows = not self._trust_db_rows or _needs_validation(model)
 
     @property
     async def client(self) -> AsyncClient:
@@ -37,26 +77,43 @@ class CRUDClickhouse(BaseCRUD[ModelType, CreateSchemaType, UpdateSchemaType]):
     # Add helper methods to access model metadata
     def get_table_name(self) -> str:
         """Get the table name from the model"""
-        return self.model.get_table_name()
+        return self._table_name
 
     def get_database_name(self) -> str:
         """Get the database name from the model"""
-        return self.model.get_database_name()
+        return self._database_name
+
+    def _from_row(self, row: Dict[str, Any]) -> ModelType:
+        """Build a model from a result row"""
+        if self._validate_rows:
+            return self.model(**row)
+        return self.model.model_construct(**row)
 
     async def get(self, id: Any) -> Optional[ModelType]:
         """Get a single record by id"""
         client = await self.client
+        result = await client.query(
+            self._get_sql,
+            parameters={"id": str(id)},
+        )
+        row = next(result.named_results(), None)
+        return self._from_row(row) if row is not None else None
+
+    async def get_multi_by_ids(self, ids: List[Any]) -> Dict[str, ModelType]:
+        """Get records for several ids with one query, keyed by id"""
+        if not ids:
+            return {}
+        client = await self.client
         result = await client.query(
             f"""
             SELECT *
-            FROM {self.model.get_table_name()}
-            WHERE id = {{id:String}}
-            LIMIT 1
+            FROM {self._table_name}
+            WHERE id IN {{ids:Array(String)}}
             """,
-            parameters={"id": str(id)},
+            # Sorted ids let ClickHouse read matching granules in order
+            parameters={"ids": sorted({str(id) for id in ids})},
         )
-        rows = result.named_results()
-        return self.model(**rows[0]) if rows else None
+        return {str(row["id"]): self._from_row(row) for row in result.named_results()}
 
     async def get_by_field(self, field: str, value: Any) -> Optional[ModelType]:
         """Get a single record by field value"""
@@ -64,14 +121,14 @@ class CRUDClickhouse(BaseCRUD[ModelType, CreateSchemaType, UpdateSchemaType]):
         result = await client.query(
             f"""
             SELECT *
-            FROM {self.model.get_table_name()}
+            FROM {self._table_name}
             WHERE {field} = {{value}}
             LIMIT 1
             """,
             parameters={"value": value},
         )
-        rows = result.named_results()
-        return self.model(**rows[0]) if rows else None
+        row = next(result.named_results(), None)
+        return self._from_row(row) if row is not None else None
 
     async def get_multi(
         self,
@@ -79,34 +136,40 @@ class CRUDClickhouse(BaseCRUD[ModelType, CreateSchemaType, UpdateSchemaType]):
         filters: Optional[Dict[str, Any]] = None,
         sort: Optional[Any] = None,
         skip: int = 0,
-        limit: int = settings.MULTI_MAX,
+        limit: Optional[int] = None,
     ) -> List[ModelType]:
-        """Get multiple records with filtering and sorting"""
+        """Get multiple records with filtering and sorting; limit defaults to MULTI_MAX"""
         client = await self.client
-        query = f"""
-            SELECT *
-            FROM {self.model.get_table_name()}
-            WHERE 1=1
-        """
-
-        params = {}
-        if filters:
-            for key, value in filters.items():
-                query += f" AND {key} = {{{key}}}"
-                params[key] = value
-
-        if sort:
-            if isinstance(sort, str):
-                query += f" ORDER BY {sort}"
-            elif isinstance(sort, list):
-                query += f" ORDER BY {', '.join(sort)}"
-            else:
-                raise ValueError("Sort parameter must be a string or a list of strings")
+        params = dict(filters) if filters else {}
+        if sort and not isinstance(sort, (str, list)):
+            raise ValueError("Sort parameter must be a string or a list of strings")
+
+        # Calls with the same filter keys and sort reuse the query text
+        cache_key = (tuple(params), tuple(sort) if isinstance(sort, list) else sort)
+        query = self._query_cache.get(cache_key)
+        if query is None:
+            query = f"""
+                SELECT *
+                FROM {self._table_name}
+            """
+
+            if params:
+                query += " WHERE " + " AND ".join(f"{key} = {{{key}}}" for key in params)
+
+            if sort:
+                if isinstance(sort, str):
+                    query += f" ORDER BY {sort}"
+                else:
+                    query += f" ORDER BY {', '.join(sort)}"
 
+            self._query_cache[cache_key] = query
+
+        if limit is None:
+            limit = get_settings().MULTI_MAX
         query += f" LIMIT {limit} OFFSET {skip}"
 
         result = await client.query(query, parameters=params)
-        return [self.model(**row) for row in result.named_results()]
+        return [self._from_row(row) for row in result.named_results()]
 
     async def create(self, obj_in: CreateSchemaType) -> ModelType:
         """Create a new record"""
@@ -114,12 +177,37 @@ class CRUDClickhouse(BaseCRUD[ModelType, CreateSchemaType, UpdateSchemaType]):
         # obj_in_data = jsonable_encoder(obj_in)
         obj_in_data = obj_in.model_dump(exclude_unset=True)
         await client.insert(
-            self.model.get_table_name(),
+            self._table_name,
             [list(obj_in_data.values())],
             column_names=list(obj_in_data.keys()),
         )
         return self.model(**obj_in_data)
 
+    async def create_many(self, objs_in: List[CreateSchemaType]) -> List[ModelType]:
+        """Create several records, with one insert per set of provided fields"""
+        client = await self.client
+        batches: Dict[Tuple[str, ...], List[List[Any]]] = {}
+        objs_in_data = []
+        for obj_in in objs_in:
+            obj_in_data = obj_in.model_dump(exclude_unset=True)
+            objs_in_data.append(obj_in_data)
+            batches.setdefault(tuple(obj_in_data), []).append(list(obj_in_data.values()))
+
+        for column_names, rows in batches.items():
+            await client.insert(self._table_name, rows, column_names=list(column_names))
+        return [self.model(**obj_in_data) for obj_in_data in objs_in_data]
+
+    async def remove_many(self, ids: List[Any]) -> bool:
+        """Delete several records by id with a single mutation"""
+        if not ids:
+            return True
+        client = await self.client
+        await client.command(
+            f"ALTER TABLE {self._table_name} DELETE WHERE id IN {{ids:Array(String)}}",
+            parameters={"ids": [str(id) for id in ids]},
+        )
+        return True
+
     async def execute_query(self, query: str, parameters: Dict[str, Any] = None) -> Any:
         """Execute a raw ClickHouse query"""
         client = await self.client
@@ -1,4 +1,3 @@
-import traceback
 from typing import Optional
 from clickhouse_connect.driver.asyncclient import AsyncClient
 from motor.core import AgnosticDatabase
@@ -36,8 +35,7 @@ async def init_db(
             logger.info(f"Superuser created: {settings.FIRST_SUPERUSER}")
 
     except Exception as e:
-        logger.error(f"Database initialization error: {str(e)}")
-        traceback.print_exc()
+        logger.exception("Database initialization error: %s", e)
         raise
 
 
@@ -0,0 +1,16 @@
+"""
+Namespace for installable Stufio modules (``stufio.modules.<name>``).
+
+Module packages are imported lazily on first attribute access (PEP 562), so
+``import stufio.modules`` stays cheap and ``stufio.modules.events`` works
+without an explicit import of the submodule.
+"""
+import importlib
+import importlib.util
+
+
+def __getattr__(name: str):
+    if name.startswith("_") or importlib.util.find_spec(f"{__name__}.{name}") is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # import_module binds the submodule on this package, so this runs once per name
+    return importlib.import_module(f"{__name__}.{name}")
@@ -0,0 +1,192 @@
+import os
+import uuid
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from stufio.core import module_registry
+from stufio.core.module_registry import ModuleDiscoverer, ModuleInterface, ModuleRegistry
+
+
+def make_package(root: Path, dotted_name: str) -> Path:
+    """Create a package (and its parent packages) under root."""
+    path = root
+    for part in dotted_name.split("."):
+        path = path / part
+        path.mkdir(exist_ok=True)
+        (path / "__init__.py").touch()
+    return path
+
+
+@pytest.fixture
+def app_package(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> str:
+    """An importable <unique>.modules package to discover app modules in."""
+    name = f"app_{uuid.uuid4().hex[:8]}"
+    make_package(tmp_path, f"{name}.modules")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setattr(module_registry, "_module_entry_points", lambda sys_path, group: ())
+    return name
+
+
+@pytest.fixture
+def cache_path(tmp_path: Path) -> str:
+    # Created up front: tmp_path is on sys.path, so creating it later changes the fingerprint
+    (tmp_path / "cache").mkdir()
+    return str(tmp_path / "cache" / "discovery.json")
+
+
+def make_discoverer(tmp_path: Path, app_package: str, **kwargs) -> ModuleDiscoverer:
+    return ModuleDiscoverer(
+        app_modules_dir=str(tmp_path / app_package / "modules"),
+        app_modules_base_import_path=f"{app_package}.modules",
+        package_prefix=f"{app_package}_installed.",
+        **kwargs,
+    )
+
+
+def test_discovery_cache_hit(
+    tmp_path: Path, app_package: str, cache_path: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    make_package(tmp_path, f"{app_package}.modules.alpha")
+    assert list(make_discoverer(tmp_path, app_package, cache_path=cache_path).discover()) == ["alpha"]
+
+    def scan(self) -> None:
+        raise AssertionError("a cached result must not be rescanned")
+
+    monkeypatch.setattr(ModuleDiscoverer, "_discover_app_modules", scan)
+    modules = make_discoverer(tmp_path, app_package, cache_path=cache_path).discover()
+    assert list(modules) == ["alpha"]
+    assert modules["alpha"].path == f"{app_package}.modules.alpha"
+
+
+def test_discovery_cache_misses_on_new_module_file(tmp_path: Path, app_package: str, cache_path: str) -> None:
+    make_package(tmp_path, f"{app_package}.modules.alpha")
+    # A directory is only a module once it has an __init__.py
+    (tmp_path / app_package / "modules" / "beta").mkdir()
+    assert list(make_discoverer(tmp_path, app_package, cache_path=cache_path).discover()) == ["alpha"]
+
+    beta_init = tmp_path / app_package / "modules" / "beta" / "__init__.py"
+    beta_init.touch()
+    beta_dir = beta_init.parent
+    stat = beta_dir.stat()
+    # Make sure the directory mtime changes even on filesystems with coarse timestamps
+    os.utime(beta_dir, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    modules = make_discoverer(tmp_path, app_package, cache_path=cache_path).discover()
+    assert sorted(modules) == ["alpha", "beta"]
+
+
+def test_discovery_cache_invalidation(tmp_path: Path, app_package: str, cache_path: str) -> None:
+    make_package(tmp_path, f"{app_package}.modules.alpha")
+    discoverer = make_discoverer(tmp_path, app_package, cache_path=cache_path)
+    discoverer.discover()
+    assert os.path.exists(cache_path)
+
+    discoverer.invalidate_cache()
+    assert not os.path.exists(cache_path)
+    discoverer.invalidate_cache()
+
+
+def test_entry_points_and_prefix_scan_are_merged(
+    tmp_path: Path, app_package: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    make_package(tmp_path, f"{app_package}_plugins.events")
+    make_package(tmp_path, f"{app_package}_installed.legacy")
+    monkeypatch.setattr(
+        module_registry,
+        "_module_entry_points",
+        lambda sys_path, group: (("events", f"{app_package}_plugins.events"),),
+    )
+
+    modules = make_discoverer(tmp_path, app_package).discover()
+
+    assert modules["events"].path == f"{app_package}_plugins.events"
+    assert modules["events"].source == "installed"
+    assert modules["legacy"].path == f"{app_package}_installed.legacy"
+
+
+def make_module(name: str, depends_on=()) -> ModuleInterface:
+    module = ModuleInterface()
+    module.name = name
+    module.depends_on = tuple(depends_on)
+    return module
+
+
+def make_registry(*modules: ModuleInterface) -> ModuleRegistry:
+    registry = ModuleRegistry()
+    for module in modules:
+        registry._add_instance(module.name, module)
+    return registry
+
+
+def test_finalize_orders_modules_by_dependencies() -> None:
+    registry = make_registry(
+        make_module("api", depends_on=["auth", "events"]),
+        make_module("auth", depends_on=["events"]),
+        make_module("events"),
+        make_module("admin"),
+    )
+
+    order = [name for name, _ in registry.finalize()]
+
+    assert order == ["events", "admin", "auth", "api"]
+    with pytest.raises(TypeError):
+        registry.modules["other"] = make_module("other")
+
+
+def test_finalize_keeps_modules_in_a_cycle() -> None:
+    registry = make_registry(
+        make_module("a", depends_on=["b"]),
+        make_module("b", depends_on=["a"]),
+        make_module("c", depends_on=["missing"]),
+    )
+
+    order = [name for name, _ in registry.finalize()]
+
+    assert order == ["c", "a", "b"]
+
+
+def test_ordered_modules_does_not_freeze_the_registry() -> None:
+    registry = make_registry(make_module("b", depends_on=["a"]), make_module("a"))
+
+    assert [name for name, _ in registry.ordered_modules] == ["a", "b"]
+
+    registry._add_instance("c", make_module("c"))
+    assert [name for name, _ in registry.ordered_modules] == ["a", "c", "b"]
+
+
+class RecordingModule(ModuleInterface):
+    def __init__(self, name: str, calls: List[str], fail: bool = False):
+        super().__init__()
+        self.name = name
+        self.calls = calls
+        self.fail = fail
+
+    async def on_startup(self, app) -> None:
+        self.calls.append(f"start {self.name}")
+        if self.fail:
+            raise RuntimeError("startup failed")
+
+    async def on_shutdown(self, app) -> None:
+        self.calls.append(f"stop {self.name}")
+        if self.fail:
+            raise RuntimeError("shutdown failed")
+
+
+@pytest.mark.asyncio
+async def test_lifecycle_hooks_isolate_failing_modules() -> None:
+    calls: List[str] = []
+    registry = make_registry(
+        RecordingModule("first", calls),
+        RecordingModule("broken", calls, fail=True),
+        RecordingModule("last", calls),
+    )
+
+    await registry.startup_all(app=None)
+    await registry.shutdown_all(app=None)
+
+    assert calls == [
+        "start first", "start broken", "start last",
+        "stop last", "stop broken", "stop first",
+    ]
@@ -0,0 +1,129 @@
+import json
+from pathlib import Path
+from typing import List
+
+import httpx
+import jwt
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, rsa
+
+from stufio.core import oauth
+from stufio.core.oauth import AppleOAuthVerifier, OAuthError, _JWKSCache
+
+
+def make_jwk(kid: str) -> dict:
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    jwk = json.loads(jwt.algorithms.RSAAlgorithm.to_jwk(key.public_key()))
+    jwk["kid"] = kid
+    return jwk
+
+
+class KeyServer(list):
+    """Key set served to the shared OAuth HTTP client, recording each fetch."""
+
+    def __init__(self):
+        super().__init__()
+        self.fetches: List[str] = []
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        self.fetches.append(str(request.url))
+        return httpx.Response(200, json={"keys": list(self)})
+
+
+@pytest.fixture
+def key_server(monkeypatch: pytest.MonkeyPatch) -> KeyServer:
+    server = KeyServer()
+    monkeypatch.setattr(oauth, "_http_client", httpx.AsyncClient(transport=httpx.MockTransport(server.handle)))
+    return server
+
+
+@pytest.mark.asyncio
+async def test_jwks_cache_reuses_keys_and_parsed_keys(key_server) -> None:
+    key_server.append(make_jwk("k1"))
+    cache = _JWKSCache("Test", "https://keys.example/certs")
+
+    first = await cache.get_key("k1")
+    second = await cache.get_key("k1")
+
+    assert first is second
+    assert len(key_server.fetches) == 1
+
+
+@pytest.mark.asyncio
+async def test_jwks_cache_refetches_for_unknown_key_id(key_server) -> None:
+    key_server.append(make_jwk("k1"))
+    cache = _JWKSCache("Test", "https://keys.example/certs", min_refresh=0)
+    await cache.get_key("k1")
+
+    key_server.append(make_jwk("k2"))
+    await cache.get_key("k2")
+
+    assert len(key_server.fetches) == 2
+
+
+@pytest.mark.asyncio
+async def test_jwks_cache_limits_refetches_for_unknown_key_ids(key_server) -> None:
+    key_server.append(make_jwk("k1"))
+    cache = _JWKSCache("Test", "https://keys.example/certs", min_refresh=60)
+    await cache.get_key("k1")
+
+    with pytest.raises(OAuthError):
+        await cache.get_key("unknown")
+
+    assert len(key_server.fetches) == 1
+
+
+@pytest.mark.asyncio
+async def test_jwks_cache_refetches_after_ttl(key_server) -> None:
+    key_server.append(make_jwk("k1"))
+    cache = _JWKSCache("Test", "https://keys.example/certs", ttl=0)
+
+    await cache.get_key("k1")
+    await cache.get_key("k1")
+
+    assert len(key_server.fetches) == 2
+
+
+@pytest.fixture
+def apple_config(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> ec.EllipticCurvePrivateKey:
+    private_key = ec.generate_private_key(ec.SECP256R1())
+    key_path = tmp_path / "apple.p8"
+    key_path.write_bytes(private_key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    ))
+    monkeypatch.setattr(oauth.settings, "APPLE_TEAM_ID", "TEAM")
+    monkeypatch.setattr(oauth.settings, "APPLE_KEY_ID", "KEY")
+    monkeypatch.setattr(oauth.settings, "APPLE_CLIENT_ID", "com.example.app")
+    monkeypatch.setattr(oauth.settings, "APPLE_PRIVATE_KEY_PATH", str(key_path))
+    monkeypatch.setattr(AppleOAuthVerifier, "_client_secret_cache", {})
+    monkeypatch.setattr(AppleOAuthVerifier, "_private_keys", {})
+    return private_key
+
+
+def test_apple_client_secret_is_reused(apple_config: ec.EllipticCurvePrivateKey) -> None:
+    secret = AppleOAuthVerifier._create_client_secret()
+
+    assert AppleOAuthVerifier._create_client_secret() == secret
+    claims = jwt.decode(
+        secret, apple_config.public_key(), algorithms=["ES256"], audience="https://appleid.apple.com"
+    )
+    assert claims["iss"] == "TEAM"
+    assert claims["sub"] == "com.example.app"
+    assert jwt.get_unverified_header(secret)["kid"] == "KEY"
+
+
+def test_apple_client_secret_is_renewed_after_ttl(
+    apple_config: ec.EllipticCurvePrivateKey, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(AppleOAuthVerifier, "APPLE_CLIENT_SECRET_TTL", 0)
+    AppleOAuthVerifier._create_client_secret()
+    cached = AppleOAuthVerifier._client_secret_cache[False]
+
+    AppleOAuthVerifier._create_client_secret()
+
+    assert AppleOAuthVerifier._client_secret_cache[False] is not cached
+    # The private key file is read once
+    assert len(AppleOAuthVerifier._private_keys) == 1
@@ -0,0 +1,59 @@
+from stufio.core.config import StufioSettings, get_settings
+from stufio.core.settings import ModuleSettings
+
+
+class ExampleSettings(ModuleSettings):
+    FOO: int = 1
+
+
+def test_missing_module_setting_is_per_instance() -> None:
+    assert getattr(get_settings(), "example_FOO", None) is None
+
+    settings = StufioSettings(modules={"example": ExampleSettings(module_name="example")})
+    assert settings.example_FOO == 1
+
+
+def test_assigning_modules_forgets_missing_settings() -> None:
+    settings = StufioSettings()
+    assert getattr(settings, "example_FOO", None) is None
+
+    settings.modules = {"example": ExampleSettings(module_name="example")}
+    assert settings.example_FOO == 1
+
+
+def test_module_settings_follow_modules_changes() -> None:
+    settings = StufioSettings(modules={"example": ExampleSettings(module_name="example", FOO=7)})
+    assert settings.example_FOO == 7
+
+    settings.modules["example"] = ExampleSettings(module_name="example", FOO=9)
+    assert settings.example_FOO == 9
+
+    settings.modules = {"example": ExampleSettings(module_name="example", FOO=11)}
+    assert settings.example_FOO == 11
+
+
+def test_lazily_initialized_module_settings_follow_modules_changes() -> None:
+    class LazySettings(ModuleSettings):
+        BAR: int = 1
+
+    StufioSettings._module_settings_registry["lazyexample"] = LazySettings
+    settings = StufioSettings()
+    assert settings.lazyexample_BAR == 1
+
+    settings.modules["lazyexample"] = LazySettings(module_name="lazyexample", BAR=5)
+    assert settings.lazyexample_BAR == 5
+
+
+def test_dict_follows_in_place_module_changes() -> None:
+    settings = StufioSettings(modules={"example": ExampleSettings(module_name="example", FOO=7)})
+    assert settings.dict()["example_FOO"] == 7
+
+    settings.modules["example"].FOO = 9
+    assert settings.dict()["example_FOO"] == 9
+
+    settings.modules["example"] = ExampleSettings(module_name="example", FOO=11)
+    assert settings.dict()["example_FOO"] == 11
+
+    result = settings.dict()
+    result["example_FOO"] = 0
+    assert settings.dict()["example_FOO"] == 11
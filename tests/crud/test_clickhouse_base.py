@@ -0,0 +1,165 @@
+import uuid
+from datetime import datetime, timezone
+from enum import Enum
+from typing import Any, Dict, List, Optional
+
+import pytest
+from pydantic import BaseModel
+
+from stufio.crud.clickhouse_base import CRUDClickhouse
+from stufio.db.clickhouse_base import ClickhouseBase
+
+
+class Status(str, Enum):
+    ACTIVE = "active"
+    BLOCKED = "blocked"
+
+
+class Location(BaseModel):
+    country: str
+
+
+class Event(ClickhouseBase):
+    id: str
+    user_id: uuid.UUID
+    created_at: datetime
+    count: int = 0
+
+
+class Account(ClickhouseBase):
+    id: str
+    status: Status
+    location: Optional[Location] = None
+
+
+class FakeResult:
+    def __init__(self, rows: List[Dict[str, Any]]):
+        self.rows = rows
+
+    def named_results(self):
+        return iter(self.rows)
+
+
+class FakeClient:
+    def __init__(self, rows: Optional[List[Dict[str, Any]]] = None):
+        self.rows = rows or []
+        self.queries: List[Any] = []
+        self.inserts: List[Any] = []
+        self.commands: List[Any] = []
+
+    async def query(self, query: str, parameters: Optional[Dict[str, Any]] = None) -> FakeResult:
+        self.queries.append((query, parameters))
+        return FakeResult(self.rows)
+
+    async def insert(self, table: str, rows: List[List[Any]], column_names: List[str]) -> None:
+        self.inserts.append((table, rows, column_names))
+
+    async def command(self, query: str, parameters: Optional[Dict[str, Any]] = None) -> None:
+        self.commands.append((query, parameters))
+
+
+def make_crud(model, client: FakeClient, crud_class=CRUDClickhouse) -> CRUDClickhouse:
+    async def client_factory():
+        return client
+
+    return crud_class(model, client_factory=client_factory)
+
+
+@pytest.mark.asyncio
+async def test_trusted_rows_keep_clickhouse_types() -> None:
+    user_id = uuid.uuid4()
+    created_at = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    client = FakeClient([{"id": "1", "user_id": user_id, "created_at": created_at, "count": 3}])
+
+    event = await make_crud(Event, client).get("1")
+
+    assert isinstance(event, Event)
+    assert event.user_id == user_id
+    assert event.created_at == created_at
+    assert event.count == 3
+
+
+@pytest.mark.asyncio
+async def test_rows_of_models_that_need_coercion_are_validated() -> None:
+    client = FakeClient([{"id": "1", "status": "blocked", "location": {"country": "CZ"}}])
+
+    accounts = await make_crud(Account, client).get_multi()
+
+    assert accounts[0].status is Status.BLOCKED
+    assert accounts[0].location == Location(country="CZ")
+
+
+@pytest.mark.asyncio
+async def test_untrusted_rows_are_validated() -> None:
+    class UntrustedCRUD(CRUDClickhouse):
+        _trust_db_rows = False
+
+    client = FakeClient([{"id": "1", "user_id": str(uuid.UUID(int=1)), "created_at": "2025-01-01T00:00:00Z", "count": "3"}])
+
+    event = await make_crud(Event, client, UntrustedCRUD).get("1")
+
+    assert event.user_id == uuid.UUID(int=1)
+    assert event.created_at == datetime(2025, 1, 1, tzinfo=timezone.utc)
+    assert event.count == 3
+
+
+class EventCreate(BaseModel):
+    id: str
+    user_id: uuid.UUID
+    created_at: datetime
+    count: int = 0
+
+
+@pytest.mark.asyncio
+async def test_get_multi_by_ids_runs_one_query_keyed_by_id() -> None:
+    created_at = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    rows = [
+        {"id": "1", "user_id": uuid.UUID(int=1), "created_at": created_at, "count": 1},
+        {"id": "2", "user_id": uuid.UUID(int=2), "created_at": created_at, "count": 2},
+    ]
+    client = FakeClient(rows)
+    crud = make_crud(Event, client)
+
+    events = await crud.get_multi_by_ids(["2", "1", "2"])
+
+    assert set(events) == {"1", "2"}
+    assert events["2"].count == 2
+    assert len(client.queries) == 1
+    assert client.queries[0][1] == {"ids": ["1", "2"]}
+    assert await crud.get_multi_by_ids([]) == {}
+    assert len(client.queries) == 1
+
+
+@pytest.mark.asyncio
+async def test_create_many_inserts_once_per_field_set() -> None:
+    client = FakeClient()
+    created_at = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    objs_in = [
+        EventCreate(id="1", user_id=uuid.UUID(int=1), created_at=created_at),
+        EventCreate(id="2", user_id=uuid.UUID(int=2), created_at=created_at, count=5),
+        EventCreate(id="3", user_id=uuid.UUID(int=3), created_at=created_at),
+    ]
+
+    events = await make_crud(Event, client).create_many(objs_in)
+
+    assert [event.id for event in events] == ["1", "2", "3"]
+    assert [event.count for event in events] == [0, 5, 0]
+    assert len(client.inserts) == 2
+    table, rows, column_names = client.inserts[0]
+    assert column_names == ["id", "user_id", "created_at"]
+    assert [row[0] for row in rows] == ["1", "3"]
+    assert client.inserts[1][2] == ["id", "user_id", "created_at", "count"]
+
+
+@pytest.mark.asyncio
+async def test_remove_many_deletes_with_one_mutation() -> None:
+    client = FakeClient()
+    crud = make_crud(Event, client)
+
+    assert await crud.remove_many([1, "2"])
+    assert await crud.remove_many([])
+
+    assert len(client.commands) == 1
+    query, parameters = client.commands[0]
+    assert query.startswith(f"ALTER TABLE {crud.get_table_name()} DELETE WHERE id IN")
+    assert parameters == {"ids": ["1", "2"]}